@@ -0,0 +1,206 @@
+"""Throughput benchmarks for the blackjack hot paths.
+
+Run from any directory::
+
+    python benchmark.py --output results.json
+    python benchmark.py --save-baseline
+    python benchmark.py --threshold 0.10   # exit 1 on a >10% regression
+"""
+import argparse
+import importlib.util
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple
+
+SECTION1 = Path(__file__).resolve().parents[2]
+BASELINE = Path(__file__).with_name("baseline.json")
+
+sys.path.insert(0, str(SECTION1 / "Chapter2"))
+import card  # noqa: E402
+import deck  # noqa: E402
+import hand  # noqa: E402
+import strategy  # noqa: E402
+from suit import Suit  # noqa: E402
+
+
+def load(name: str, path: Path) -> ModuleType:
+    """Import a module whose bare name collides with one already imported."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)  # type: ignore
+    return module
+
+
+chapter4_hand = load("chapter4_hand", SECTION1 / "Chapter4" / "hand.py")
+
+Benchmark = Tuple[str, Callable[[], Any]]
+
+
+def card_benchmarks() -> List[Benchmark]:
+    def factory_run(factory: Callable[[int, Suit], Any]) -> Callable[[], Any]:
+        return lambda: [factory(r, s) for r in range(1, 14) for s in Suit]
+
+    cf = card.CardFactory()
+    return [
+        ("card", factory_run(card.card)),
+        ("card4", factory_run(card.card4)),
+        ("card5", factory_run(card.card5)),
+        ("card6", factory_run(card.card6)),
+        ("card7", factory_run(card.card7)),
+        ("CardFactory", lambda: [cf.rank(r).suit(s) for r in range(1, 14) for s in Suit]),
+    ]
+
+
+def deck_benchmarks() -> List[Benchmark]:
+    def deal(shoe: Any) -> None:
+        while len(shoe) > 0:
+            shoe.pop()
+
+    def deal_deck() -> None:
+        shoe = deck.Deck()
+        while shoe._cards:
+            shoe.pop()
+
+    return [
+        ("Deck build", deck.Deck),
+        ("Deck2 build", deck.Deck2),
+        ("Deck3(6) build", lambda: deck.Deck3(decks=6)),
+        ("Deck build+deal", deal_deck),
+        ("Deck2 build+deal", lambda: deal(deck.Deck2())),
+        ("Deck3(6) build+deal", lambda: deal(deck.Deck3(decks=6))),
+    ]
+
+
+def hand_benchmarks() -> List[Benchmark]:
+    cards = [chapter4_hand.Card(r, "♣") for r in (2, 5, 3, 4, 6)]
+
+    def totals(hand_class: type) -> Callable[[], int]:
+        def run() -> int:
+            h = hand_class(cards[0], cards[1], cards[2])
+            t = h.total
+            h.card = cards[3]
+            t += h.total
+            h.card = cards[4]
+            return t + h.total
+        return run
+
+    return [
+        ("Hand_Lazy totals", totals(chapter4_hand.Hand_Lazy)),
+        ("Hand_Eager totals", totals(chapter4_hand.Hand_Eager)),
+    ]
+
+
+def strategy_benchmarks() -> List[Benchmark]:
+    play = strategy.GameStrategy()
+    h = hand.Hand2(card.card(10, Suit.Club), card.card(9, Suit.Heart), card.card(7, Suit.Spade))
+
+    def decide() -> bool:
+        return (
+            play.insurance(h) or play.split(h) or play.double(h) or play.hit(h)
+        )
+
+    return [("GameStrategy decision", decide)]
+
+
+def round_benchmarks() -> List[Benchmark]:
+    betting, play = strategy.Flat(), strategy.GameStrategy()
+    shoe: List[Any] = []
+
+    def one_round() -> None:
+        nonlocal shoe
+        if len(shoe) < 20:
+            shoe = deck.Deck3(decks=6)
+        betting.bet()
+        h = hand.Hand2(shoe.pop(), shoe.pop(), shoe.pop())
+        while play.hit(h):
+            h.card_append(shoe.pop())
+        if h.hard_total() <= 21:
+            betting.record_win()
+        else:
+            betting.record_loss()
+
+    return [("round", one_round)]
+
+
+def all_benchmarks() -> List[Benchmark]:
+    return (
+        card_benchmarks() + deck_benchmarks() + hand_benchmarks()
+        + strategy_benchmarks() + round_benchmarks()
+    )
+
+
+def measure(function: Callable[[], Any], repeat: int) -> float:
+    """Best-of-``repeat`` operations per second."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return number / best
+
+
+def run(repeat: int, only: str = "") -> Dict[str, Any]:
+    results = {
+        name: measure(function, repeat)
+        for name, function in all_benchmarks()
+        if only in name
+    }
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "ops_per_sec": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    regressions = []
+    for name, ops in current["ops_per_sec"].items():
+        base = baseline["ops_per_sec"].get(name)
+        if base is None:
+            continue
+        change = ops / base - 1
+        print(f"{name:<24}{ops:>14,.0f}{base:>14,.0f}{change:>+9.1%}")
+        if change < -threshold:
+            regressions.append(name)
+    return regressions
+
+
+def get_options(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", default="", help="Run benchmarks whose name contains this")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str]) -> int:
+    options = get_options(argv)
+    results = run(options.repeat, options.only)
+    document = json.dumps(results, indent=2)
+
+    if options.output:
+        options.output.write_text(document)
+    if options.save_baseline:
+        options.baseline.write_text(document)
+        print(document)
+        return 0
+
+    if not options.baseline.exists():
+        print(document)
+        return 0
+
+    baseline = json.loads(options.baseline.read_text())
+    regressions = compare(results, baseline, options.threshold)
+    if regressions:
+        print(f"Regressions over {options.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -1,4 +1,5 @@
 import random
+from typing import Dict, List, Optional, Sequence
 from card import *
 from suit import Suit
 
@@ -25,10 +26,26 @@ class Deck2(list):
         random.shuffle(self)
 
 
+HI_LO = (-1, 1, 1, 1, 1, 1, 0, 0, 0, -1)
+KO = (-1, 1, 1, 1, 1, 1, 1, 0, 0, -1)
+"""Counting weights by point value: index 0 is aces, index 9 is ten-valued cards."""
+
+
 class Deck3(list):
-    """More requirements and another design"""
+    """More requirements and another design
 
-    def __init__(self, decks: int = 1) -> None:
+    Every ``pop()`` updates the remaining count per point value and one
+    running count per counting system in O(1). Dealt and burned cards are
+    kept as discards so ``shuffle()`` reuses the same card objects once the
+    cut card (``penetration``) is reached.
+    """
+
+    def __init__(
+            self,
+            decks: int = 1,
+            systems: Optional[Dict[str, Sequence[int]]] = None,
+            penetration: float = 0.75
+    ) -> None:
         super().__init__()
         for i in range(decks):
             self.extend(
@@ -36,10 +53,57 @@ class Deck3(list):
                 for r in range(13) for s in iter(Suit)
             )
 
+        self.decks = decks
+        self.systems = systems if systems is not None else {"hi_lo": HI_LO}
+        self.penetration_limit = penetration
+        self.discards: List[Card] = []
+        self.shuffle()
+
+    def shuffle(self) -> None:
+        self.extend(self.discards)
+        self.discards.clear()
         random.shuffle(self)
+
+        self.size = len(self)
+        self.remaining = [0] * 10
+        for c in self:
+            self.remaining[c.hard - 1] += 1
+        self.running = dict.fromkeys(self.systems, 0)
+
+        # Burned cards stay unseen: they leave the shoe but not the composition.
         burn = random.randint(1, 32)
         for i in range(burn):
-            self.pop()
+            self.discards.append(super().pop())
+
+    def pop(self, index: int = -1) -> Card:
+        c = self.deal_hidden(index)
+        self.reveal(c)
+        return c
+
+    def deal_hidden(self, index: int = -1) -> Card:
+        """Deal a face-down card: it leaves the shoe but stays unseen until ``reveal()``."""
+        c = super().pop(index)
+        self.discards.append(c)
+        return c
+
+    def reveal(self, c: Card) -> None:
+        value = c.hard - 1
+        self.remaining[value] -= 1
+        for name, weights in self.systems.items():
+            self.running[name] += weights[value]
+
+    def unseen(self) -> int:
+        return sum(self.remaining)
+
+    def true_count(self, system: str = "hi_lo") -> float:
+        return self.running[system] * 52 / max(self.unseen(), 1)
+
+    @property
+    def penetration(self) -> float:
+        return 1 - len(self) / self.size
+
+    def needs_shuffle(self) -> bool:
+        return self.penetration >= self.penetration_limit
 
 
 if __name__ == '__main__':
@@ -1,4 +1,4 @@
-from typing import List, Union, Optional, overload
+from typing import Iterator, List, NamedTuple, Union, Optional, cast, overload
 from deck import Deck
 from card import *
 
@@ -132,4 +132,88 @@ class Hand5:
         return hand0, hand1
 
     def __str__(self) -> str:
-        return ", ".join(map(str, self.cards))
\ No newline at end of file
+        return ", ".join(map(str, self.cards))
+
+
+class CardNode(NamedTuple):
+    """One immutable link of a hand; running totals make every total O(1)."""
+    card: Card
+    parent: Optional["CardNode"]
+    size: int
+    hard: int
+    soft: int
+
+
+def _link(parent: Optional[CardNode], card: Card) -> CardNode:
+    if parent is None:
+        return CardNode(card, None, 1, card.hard, card.soft)
+    return CardNode(card, parent, parent.size + 1, parent.hard + card.hard, parent.soft + card.soft)
+
+
+class Hand6:
+    """Copy-on-write hand: clones share an immutable chain of cards.
+
+    Appending links a new node onto this hand's tail and never touches the
+    shared prefix, so clone, split and append are all O(1) and a search can
+    branch thousands of hypothetical hands without copying card lists.
+    """
+
+    __slots__ = ("dealer_card", "_tail")
+
+    def __init__(self, dealer_card: Card, *cards: Card) -> None:
+        self.dealer_card = dealer_card
+        self._tail: Optional[CardNode] = None
+        for c in cards:
+            self._tail = _link(self._tail, c)
+
+    @classmethod
+    def _from_tail(cls, dealer_card: Card, tail: Optional[CardNode]) -> "Hand6":
+        hand = cls.__new__(cls)
+        hand.dealer_card = dealer_card
+        hand._tail = tail
+        return hand
+
+    def clone(self) -> "Hand6":
+        return self._from_tail(self.dealer_card, self._tail)
+
+    def card_append(self, card: Card) -> None:
+        self._tail = _link(self._tail, card)
+
+    def __add__(self, card: Card) -> "Hand6":
+        return self._from_tail(self.dealer_card, _link(self._tail, card))
+
+    def split(self, card0: Card, card1: Card) -> Tuple["Hand6", "Hand6"]:
+        if self._tail is None or self._tail.size != 2:
+            raise ValueError("Only a two-card hand can be split")
+        first = cast(CardNode, self._tail.parent)
+        hand0 = self._from_tail(self.dealer_card, _link(first, card0))
+        hand1 = self._from_tail(self.dealer_card, _link(_link(None, self._tail.card), card1))
+        return hand0, hand1
+
+    def __len__(self) -> int:
+        return self._tail.size if self._tail else 0
+
+    def __iter__(self) -> Iterator[Card]:
+        return iter(self.cards)
+
+    @property
+    def cards(self) -> List[Card]:
+        cards: List[Card] = []
+        node = self._tail
+        while node is not None:
+            cards.append(node.card)
+            node = node.parent
+        cards.reverse()
+        return cards
+
+    def hard_total(self) -> int:
+        return self._tail.hard if self._tail else 0
+
+    def soft_total(self) -> int:
+        return self._tail.soft if self._tail else 0
+
+    def __str__(self) -> str:
+        return ", ".join(map(str, self.cards))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} ({self.dealer_card!r}, *{self.cards})"
@@ -0,0 +1,131 @@
+import json
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple, TypeVar
+
+import deck
+import strategy
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Profiler:
+    """Cumulative wall-clock time and call counts per named phase.
+
+    A disabled profiler costs one attribute check per timed call. Use
+    ``instrument()`` instead of ``timed()`` for existing methods: nothing
+    is wrapped at all until profiling is switched on.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.totals: Dict[str, int] = {}
+        self.counts: Dict[str, int] = {}
+
+    def add(self, name: str, elapsed_ns: int) -> None:
+        self.totals[name] = self.totals.get(name, 0) + elapsed_ns
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter_ns() - start)
+
+    def timed(self, name: str) -> Callable[[F], F]:
+        def concrete_decorator(function: F) -> F:
+            @wraps(function)
+            def wrapped(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                start = time.perf_counter_ns()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.add(name, time.perf_counter_ns() - start)
+            return wrapped  # type: ignore
+        return concrete_decorator
+
+    def reset(self) -> None:
+        self.totals.clear()
+        self.counts.clear()
+
+    def summary(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "phase": name,
+                "calls": self.counts[name],
+                "total_s": total / 1e9,
+                "per_call_us": total / self.counts[name] / 1e3,
+            }
+            for name, total in sorted(self.totals.items(), key=lambda item: -item[1])
+        ]
+
+    def report(self) -> str:
+        lines = [f"{'phase':<24}{'calls':>10}{'total s':>12}{'us/call':>10}"]
+        for row in self.summary():
+            lines.append(
+                f"{row['phase']:<24}{row['calls']:>10}"
+                f"{row['total_s']:>12.4f}{row['per_call_us']:>10.2f}"
+            )
+        return "\n".join(lines)
+
+    def export(self, path: Path) -> None:
+        path.write_text(json.dumps(self.summary(), indent=2))
+
+
+def _hot_paths() -> List[Tuple[Any, str, str]]:
+    """(owner, attribute, phase) for every method worth timing in a round."""
+    targets = [
+        (deck.Deck3, "__init__", "shoe"),
+        (deck.Deck3, "shuffle", "shuffle"),
+        (deck, "card", "card"),
+        (strategy.GameStrategy, "insurance", "decision"),
+        (strategy.GameStrategy, "split", "decision"),
+        (strategy.GameStrategy, "double", "decision"),
+        (strategy.GameStrategy, "hit", "decision"),
+    ]
+    for cls in [strategy.BettingStrategy, *strategy.BettingStrategy.__subclasses__()]:
+        for name, phase in (("bet", "bet"), ("record_win", "settle"), ("record_loss", "settle")):
+            if name in vars(cls):
+                targets.append((cls, name, phase))
+    return targets
+
+
+@contextmanager
+def instrument(profiler: Profiler) -> Iterator[Profiler]:
+    """Wrap the hot-path methods for the duration of the block, then restore them."""
+    originals = [(owner, name, phase, getattr(owner, name)) for owner, name, phase in _hot_paths()]
+    profiler.enabled = True
+    for owner, name, phase, original in originals:
+        setattr(owner, name, profiler.timed(phase)(original))
+    try:
+        yield profiler
+    finally:
+        for owner, name, _, original in originals:
+            setattr(owner, name, original)
+        profiler.enabled = False
+
+
+if __name__ == '__main__':
+    from hand import Hand2
+
+    profiler = Profiler()
+    with instrument(profiler):
+        betting, play = strategy.Flat(), strategy.GameStrategy()
+        for _ in range(1_000):
+            shoe = deck.Deck3(decks=6)
+            while len(shoe) > 20:
+                betting.bet()
+                hand = Hand2(shoe.pop(), shoe.pop(), shoe.pop())
+                while play.hit(hand):
+                    hand.card_append(shoe.pop())
+                betting.record_win() if hand.hard_total() <= 21 else betting.record_loss()
+    print(profiler.report())
@@ -0,0 +1,215 @@
+import pickle
+from pathlib import Path
+from typing import Collection, Dict, Iterable, List, Optional, Tuple
+
+from card import Card
+from deck import Deck3
+from hand import Hand2
+from strategy import GameStrategy
+
+Shoe = Tuple[int, ...]
+"""Remaining cards by point value: index 0 is aces, index 9 is all ten-valued cards."""
+
+DealerOutcome = Tuple[float, float, float, float, float, float]
+"""Probabilities of the dealer finishing on 17, 18, 19, 20, 21 or busting."""
+
+
+def composition(cards: Iterable[Card]) -> Shoe:
+    counts = [0] * 10
+    for c in cards:
+        counts[c.hard - 1] += 1
+    return tuple(counts)
+
+
+def remove(shoe: Shoe, index: int) -> Shoe:
+    counts = list(shoe)
+    counts[index] -= 1
+    return tuple(counts)
+
+
+def best_total(hard: int, soft: bool) -> int:
+    return hard + 10 if soft and hard + 10 <= 21 else hard
+
+
+class Solver:
+    """Expectimax values of stand, hit, double and split.
+
+    The dealer checks for blackjack first, so the player only ever acts
+    against a dealer without a natural. Every evaluated state is stored in
+    a transposition table keyed by (hard total, soft flag, card count,
+    shoe counts), so equivalent hands reached along different paths are
+    evaluated once. The tables persist between runs with ``save()``.
+
+    Split is valued as two independent hands that each draw from the shoe
+    left after the pair, with no re-splitting. Split aces take one card each.
+    """
+
+    def __init__(self, hit_soft_17: bool = False, path: Optional[Path] = None) -> None:
+        self.hit_soft_17 = hit_soft_17
+        self.path = path
+        self.dealer_table: Dict[Tuple, DealerOutcome] = {}
+        self.player_table: Dict[Tuple, float] = {}
+        if path is not None and path.exists():
+            with path.open("rb") as source:
+                self.dealer_table, self.player_table = pickle.load(source)
+
+    def save(self, path: Optional[Path] = None) -> None:
+        target = path or self.path
+        if target is None:
+            raise ValueError("No path to save the transposition table")
+        with target.open("wb") as sink:
+            pickle.dump((self.dealer_table, self.player_table), sink, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def dealer(self, hard: int, soft: bool, count: int, shoe: Shoe) -> DealerOutcome:
+        # Only the first card's count matters: it decides whether the peek applies.
+        key = ("dealer", self.hit_soft_17, hard, soft, count == 1, shoe)
+        if key in self.dealer_table:
+            return self.dealer_table[key]
+
+        total = best_total(hard, soft)
+        if hard > 21:
+            result: DealerOutcome = (0, 0, 0, 0, 0, 1)
+        elif total > 17 or (total == 17 and not (self.hit_soft_17 and soft and hard + 10 == 17)):
+            outcome = [0.0] * 6
+            outcome[total - 17] = 1.0
+            result = tuple(outcome)  # type: ignore
+        else:
+            # After the peek, the hole card never completes a dealer blackjack.
+            excluded = {0: 9, 9: 0}.get(hard - 1) if count == 1 else None
+            remaining = sum(n for i, n in enumerate(shoe) if i != excluded)
+            outcome = [0.0] * 6
+            for i, n in enumerate(shoe):
+                if n == 0 or i == excluded:
+                    continue
+                p = n / remaining
+                branch = self.dealer(hard + i + 1, soft or i == 0, count + 1, remove(shoe, i))
+                for j in range(6):
+                    outcome[j] += p * branch[j]
+            result = tuple(outcome)  # type: ignore
+
+        self.dealer_table[key] = result
+        return result
+
+    def stand(self, hard: int, soft: bool, count: int, up: int, shoe: Shoe) -> float:
+        if hard > 21:
+            return -1.0
+        total = best_total(hard, soft)
+        if total == 21 and count == 2:
+            return 1.5
+        key = ("stand", self.hit_soft_17, hard, soft, count, up, shoe)
+        if key not in self.player_table:
+            outcome = self.dealer(up + 1, up == 0, 1, shoe)
+            ev = outcome[5]
+            for j in range(5):
+                dealer_total = 17 + j
+                ev += outcome[j] * ((total > dealer_total) - (total < dealer_total))
+            self.player_table[key] = ev
+        return self.player_table[key]
+
+    def _draw(self, shoe: Shoe) -> Iterable[Tuple[int, float]]:
+        remaining = sum(shoe)
+        return ((i, n / remaining) for i, n in enumerate(shoe) if n)
+
+    def hit(self, hard: int, soft: bool, count: int, up: int, shoe: Shoe) -> float:
+        key = ("hit", self.hit_soft_17, hard, soft, count, up, shoe)
+        if key not in self.player_table:
+            ev = 0.0
+            for i, p in self._draw(shoe):
+                ev += p * self.best(hard + i + 1, soft or i == 0, count + 1, up, remove(shoe, i))
+            self.player_table[key] = ev
+        return self.player_table[key]
+
+    def best(self, hard: int, soft: bool, count: int, up: int, shoe: Shoe) -> float:
+        """Value of playing on with only stand or hit available."""
+        if hard > 21:
+            return -1.0
+        if best_total(hard, soft) == 21:
+            return self.stand(hard, soft, count, up, shoe)
+        return max(self.stand(hard, soft, count, up, shoe), self.hit(hard, soft, count, up, shoe))
+
+    def double(self, hard: int, soft: bool, count: int, up: int, shoe: Shoe) -> float:
+        ev = 0.0
+        for i, p in self._draw(shoe):
+            ev += p * self.stand(hard + i + 1, soft or i == 0, count + 1, up, remove(shoe, i))
+        return 2 * ev
+
+    def split(self, pair: int, up: int, shoe: Shoe) -> float:
+        # Split hands start from a card count of 3 so a two-card 21 is never paid as a blackjack.
+        ev = 0.0
+        for i, p in self._draw(shoe):
+            hard, soft, after = pair + i + 2, pair == 0 or i == 0, remove(shoe, i)
+            if pair == 0:
+                # Split aces receive one card each.
+                ev += p * self.stand(hard, soft, 3, up, after)
+            else:
+                ev += p * max(
+                    self.best(hard, soft, 3, up, after),
+                    self.double(hard, soft, 3, up, after),
+                )
+        return 2 * ev
+
+    def evaluate(
+            self,
+            cards: List[Card],
+            dealer_card: Card,
+            shoe: Shoe,
+            allowed: Collection[str] = ("stand", "hit", "double", "split")
+    ) -> Dict[str, float]:
+        """Expected value per unit bet of every legal action in ``allowed`` for this hand.
+
+        ``shoe`` is the composition of the unseen cards, which excludes
+        ``cards`` and ``dealer_card`` but includes the dealer's hole card.
+        Stand is always evaluated.
+        """
+        hard = sum(c.hard for c in cards)
+        soft = any(c.hard == 1 for c in cards)
+        count, up = len(cards), dealer_card.hard - 1
+        actions = {"stand": self.stand(hard, soft, count, up, shoe)}
+        if "hit" in allowed and hard <= 21 and best_total(hard, soft) < 21:
+            actions["hit"] = self.hit(hard, soft, count, up, shoe)
+        if count == 2 and hard <= 21:
+            if "double" in allowed:
+                actions["double"] = self.double(hard, soft, count, up, shoe)
+            if "split" in allowed and cards[0].hard == cards[1].hard:
+                actions["split"] = self.split(cards[0].hard - 1, up, shoe)
+        return actions
+
+
+class ExpectimaxStrategy(GameStrategy):
+    """Composition-dependent play: each decision is the solver's best action.
+
+    The table asks split, then double, then hit as yes/no questions, so each
+    question compares only the actions still open at that point: a hand
+    offered double has declined or can't split, and a hand asked to hit
+    can only otherwise stand.
+    """
+
+    def __init__(self, solver: Solver, shoe: Deck3) -> None:
+        self.solver = solver
+        self.shoe = shoe
+
+    def _best(self, hand: Hand2, allowed: Collection[str]) -> str:
+        actions = self.solver.evaluate(hand.cards, hand.dealer_card, tuple(self.shoe.remaining), allowed)
+        return max(actions, key=actions.__getitem__)
+
+    def split(self, hand: Hand2) -> bool:
+        return self._best(hand, ("stand", "hit", "double", "split")) == "split"
+
+    def double(self, hand: Hand2) -> bool:
+        return self._best(hand, ("stand", "hit", "double")) == "double"
+
+    def hit(self, hand: Hand2) -> bool:
+        return self._best(hand, ("stand", "hit")) == "hit"
+
+
+if __name__ == '__main__':
+    from suit import Suit
+    from card import card
+
+    solver = Solver(path=Path("expectimax.pickle"))
+    hand = Hand2(card(6, Suit.Club), card(10, Suit.Heart), card(6, Suit.Spade))
+    unseen = composition(Deck3(decks=6))
+    for c in [hand.dealer_card, *hand.cards]:
+        unseen = remove(unseen, c.hard - 1)
+    print(hand.dealer_card.rank, [c.rank for c in hand.cards], solver.evaluate(hand.cards, hand.dealer_card, unseen))
+    solver.save()
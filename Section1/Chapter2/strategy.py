@@ -1,4 +1,5 @@
 from hand import *
+from deck import Deck3
 from abc import abstractmethod, ABCMeta
 
 
@@ -34,6 +35,20 @@ class Flat(BettingStrategy):
         return 1
 
 
+class CountingBet(BettingStrategy):
+    """Bet spread driven by the shoe's true count, read in O(1) from Deck3."""
+
+    def __init__(self, shoe: Deck3, unit: int = 1, spread: int = 8, system: str = "hi_lo") -> None:
+        self.shoe = shoe
+        self.unit = unit
+        self.spread = spread
+        self.system = system
+
+    def bet(self) -> int:
+        true_count = int(self.shoe.true_count(self.system))
+        return self.unit * min(max(true_count, 1), self.spread)
+
+
 class BettingStrategy2(metaclass=ABCMeta):
     @abstractmethod
     def bet(self) -> int:
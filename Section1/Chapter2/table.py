@@ -1,5 +1,6 @@
 from deck import *
 from hand import *
+from strategy import BettingStrategy, GameStrategy
 
 class Table:
     def __init__(self) -> None:
@@ -23,4 +24,152 @@ class Table:
         return self.hand
 
     def can_insure(self, hand: Hand) -> bool:
-        return hand.dealer_card.insure
\ No newline at end of file
+        return hand.dealer_card.insure
+
+def best_total(cards: List[Card]) -> int:
+    hard = sum(c.hard for c in cards)
+    if hard + 10 <= 21 and any(c.hard == 1 for c in cards):
+        return hard + 10
+    return hard
+
+
+def is_blackjack(cards: List[Card]) -> bool:
+    return len(cards) == 2 and best_total(cards) == 21
+
+
+class Seat:
+    def __init__(
+            self,
+            bet_strategy: BettingStrategy,
+            game_strategy: GameStrategy,
+            stake: int = 100
+    ) -> None:
+        self.bet_strategy = bet_strategy
+        self.game_strategy = game_strategy
+        self.stake = stake
+        self.wins = 0
+        self.losses = 0
+        self.pushes = 0
+
+    def settle(self, amount: float) -> None:
+        self.stake += amount
+        if amount > 0:
+            self.wins += 1
+            self.bet_strategy.record_win()
+        elif amount < 0:
+            self.losses += 1
+            self.bet_strategy.record_loss()
+        else:
+            self.pushes += 1
+
+
+class MultiSeatTable:
+    """Up to seven seats dealt from one shared Deck3 shoe in casino order.
+
+    Each round deals one card to every seat, the dealer's up card, a second
+    card to every seat and the hole card. The hole card is dealt face down,
+    so the shoe's counts still include it while seats act. Seats then act
+    in order and the dealer's hand is drawn and totalled once for the whole
+    table. Split hands are not re-split and insurance is not offered.
+
+    Count-driven strategies need the table's shoe, so build it first and
+    pass it in::
+
+        shoe = Deck3(6)
+        seat = Seat(CountingBet(shoe), ExpectimaxStrategy(solver, shoe))
+        table = MultiSeatTable([seat], shoe=shoe)
+    """
+
+    max_seats = 7
+
+    def __init__(
+            self,
+            seats: List[Seat],
+            decks: int = 6,
+            hit_soft_17: bool = False,
+            payout: Tuple[int, int] = (3, 2),
+            penetration: float = 0.75,
+            shoe: Optional[Deck3] = None
+    ) -> None:
+        """``decks`` and ``penetration`` only apply when no ``shoe`` is given."""
+        if not 1 <= len(seats) <= self.max_seats:
+            raise ValueError(f"A table seats 1 to {self.max_seats} players, not {len(seats)}")
+        self.seats = seats
+        self.shoe = shoe if shoe is not None else Deck3(decks, penetration=penetration)
+        self.hit_soft_17 = hit_soft_17
+        self.payout = payout[0] / payout[1]
+        self.rounds = 0
+
+    def _play_hand(self, seat: Seat, hand: Hand2, bet: int, split_allowed: bool) -> List[Tuple[Hand2, int]]:
+        strategy = seat.game_strategy
+        if split_allowed and len(hand.cards) == 2 and hand.cards[0].hard == hand.cards[1].hard and strategy.split(hand):
+            first, second = hand.cards
+            left = Hand2(hand.dealer_card, first, self.shoe.pop())
+            right = Hand2(hand.dealer_card, second, self.shoe.pop())
+            if first.hard == 1:
+                # Split aces take one card each.
+                return [(left, bet), (right, bet)]
+            return self._play_hand(seat, left, bet, False) + self._play_hand(seat, right, bet, False)
+
+        if len(hand.cards) == 2 and strategy.double(hand):
+            hand.card_append(self.shoe.pop())
+            return [(hand, 2 * bet)]
+
+        while best_total(hand.cards) < 21 and strategy.hit(hand):
+            hand.card_append(self.shoe.pop())
+        return [(hand, bet)]
+
+    def _play_dealer(self, dealer: List[Card]) -> int:
+        while True:
+            total = best_total(dealer)
+            soft = total != sum(c.hard for c in dealer)
+            if total > 17 or (total == 17 and not (soft and self.hit_soft_17)):
+                return total
+            dealer.append(self.shoe.pop())
+
+    def round(self) -> None:
+        if self.shoe.needs_shuffle():
+            self.shoe.shuffle()
+        self.rounds += 1
+
+        bets = [seat.bet_strategy.bet() for seat in self.seats]
+        first = [self.shoe.pop() for _ in self.seats]
+        up_card = self.shoe.pop()
+        second = [self.shoe.pop() for _ in self.seats]
+        hole_card = self.shoe.deal_hidden()
+        dealer = [up_card, hole_card]
+        hands = [Hand2(up_card, a, b) for a, b in zip(first, second)]
+
+        if is_blackjack(dealer):
+            self.shoe.reveal(hole_card)
+            for seat, hand, bet in zip(self.seats, hands, bets):
+                seat.settle(0 if is_blackjack(hand.cards) else -bet)
+            return
+
+        played: List[Tuple[Seat, Hand2, int]] = []
+        for seat, hand, bet in zip(self.seats, hands, bets):
+            if is_blackjack(hand.cards):
+                seat.settle(bet * self.payout)
+                continue
+            for final, amount in self._play_hand(seat, hand, bet, True):
+                played.append((seat, final, amount))
+
+        self.shoe.reveal(hole_card)
+        # The dealer draws once for the whole table, and not at all if every hand busted.
+        live = any(best_total(hand.cards) <= 21 for _, hand, _ in played)
+        dealer_total = self._play_dealer(dealer) if live else 0
+
+        for seat, hand, bet in played:
+            total = best_total(hand.cards)
+            if total > 21:
+                seat.settle(-bet)
+            elif dealer_total > 21 or total > dealer_total:
+                seat.settle(bet)
+            elif total < dealer_total:
+                seat.settle(-bet)
+            else:
+                seat.settle(0)
+
+    def play(self, rounds: int) -> None:
+        for _ in range(rounds):
+            self.round()
@@ -0,0 +1,100 @@
+import struct
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple, Union
+
+from dunder_bytes import Card2, Suit
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+SUITS = list(Suit)
+RANK_NAMES = {1: "A", 11: "J", 12: "Q", 13: "K"}
+RANK_NUMBERS = {"A": 1, "J": 11, "Q": 12, "K": 13}
+
+
+def _points(rank: int) -> Tuple[int, int]:
+    if rank == 1:
+        return 1, 11
+    return min(rank, 10), min(rank, 10)
+
+
+# One byte per card: (rank - 1) * 4 + suit index, so 52 codes from 0 to 51.
+DECODE: List[Tuple[str, Suit, int, int]] = [
+    (RANK_NAMES.get(rank, str(rank)), suit, *_points(rank))
+    for rank in range(1, 14)
+    for suit in SUITS
+]
+ENCODE: Dict[Tuple[str, Suit], int] = {
+    (rank_str, suit): code for code, (rank_str, suit, _, _) in enumerate(DECODE)
+}
+
+
+def encode_card(card: Card2) -> int:
+    try:
+        return ENCODE[card.rank, card.suit]
+    except KeyError:
+        rank = RANK_NUMBERS.get(card.rank) or int(card.rank)
+        return (rank - 1) * 4 + SUITS.index(card.suit)
+
+
+def decode_card(code: int) -> Card2:
+    return Card2(*DECODE[code])
+
+
+def encode_many(cards: Iterable[Card2]) -> bytes:
+    return bytes(encode_card(c) for c in cards)
+
+
+def decode_many(buffer: Buffer) -> List[Card2]:
+    return [Card2(*DECODE[code]) for code in memoryview(buffer).cast("B")]
+
+
+class HandRecord(NamedTuple):
+    dealer_card: Card2
+    cards: List[Card2]
+
+
+def encode_hand(dealer_card: Card2, cards: List[Card2]) -> bytes:
+    """Card count, then the dealer's card, then the player's cards."""
+    return bytes((len(cards), encode_card(dealer_card))) + encode_many(cards)
+
+
+def encode_hands(hands: Iterable[HandRecord]) -> bytes:
+    return b"".join(encode_hand(h.dealer_card, h.cards) for h in hands)
+
+
+def decode_hands(buffer: Buffer) -> Iterator[HandRecord]:
+    view = memoryview(buffer).cast("B")
+    offset = 0
+    while offset < len(view):
+        count, dealer = view[offset], view[offset + 1]
+        start = offset + 2
+        yield HandRecord(decode_card(dealer), decode_many(view[start:start + count]))
+        offset = start + count
+
+
+class RoundRecord(NamedTuple):
+    round: int
+    seat: int
+    bet: int
+    net: float
+    player_total: int
+    dealer_total: int
+
+
+ROUND = struct.Struct("<IBIfBB")
+
+
+def pack_rounds(rounds: Iterable[RoundRecord]) -> bytes:
+    return b"".join(ROUND.pack(*r) for r in rounds)
+
+
+def unpack_rounds(buffer: Buffer) -> List[RoundRecord]:
+    return [RoundRecord(*fields) for fields in ROUND.iter_unpack(buffer)]
+
+
+if __name__ == '__main__':
+    hand = HandRecord(Card2("K", Suit.Heart, 10, 10), [Card2("A", Suit.Club, 1, 11), Card2("7", Suit.Spade, 7, 7)])
+    print(bytes(hand.cards[0]), "vs", encode_many(hand.cards[:1]))
+    data = encode_hands([hand, hand])
+    print(len(data), list(decode_hands(data)))
+    rounds = pack_rounds([RoundRecord(1, 0, 10, 15.0, 21, 20)])
+    print(len(rounds), unpack_rounds(rounds))
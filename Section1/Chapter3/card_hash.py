@@ -1,6 +1,7 @@
 from enum import Enum
 import sys
-from typing import Any, cast
+from collections import Counter
+from typing import Any, Tuple, cast
 
 
 class Suit(str, Enum):
@@ -80,6 +81,7 @@ class Card3:
         self.suit = suit
         self.hard = hard
         self.soft = soft
+        self._hash = (hash(self.suit) + 4 * hash(self.rank)) % sys.hash_info.modulus
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__} (suit={self.suit!r}, rank={self.rank!r})"
@@ -93,6 +95,9 @@ class Card3:
                 and self.rank == cast(Card3, other).rank
         )
 
+    def __hash__(self) -> int:
+        return self._hash
+
 
 class AceCard3(Card3):
     insure = True
@@ -135,17 +140,26 @@ class Hand:
 
 
 class FrozenHand(Hand):
+    """Immutable hand whose hash and canonical key are computed once."""
+
     def __init__(self, *args, **kwargs) -> None:
         if len(args) == 1 and isinstance(args[0], Hand):
             # Clone a hand
             other = cast(Hand, args[0])
             self.dealer_card = other.dealer_card
+            self.cards = tuple(other.cards)
         else:
             # Build a fresh Hand from Card instances.
             super().__init__(*args, **kwargs)
 
+        self._hash = sum(hash(c) for c in self.cards) % sys.hash_info.modulus
+        self.canonical_key: Tuple[str, Tuple[Tuple[str, int], ...]] = (
+            self.dealer_card.rank,
+            tuple(sorted(Counter(c.rank for c in self.cards).items()))
+        )
+
     def __hash__(self) -> int:
-        return sum(hash(c) for c in self.cards) % sys.hash_info.modulus
+        return self._hash
 
 
 if __name__ == '__main__':
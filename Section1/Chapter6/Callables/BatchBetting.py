@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+ONE_THREE_TWO_SIX = np.array([1, 3, 2, 6], dtype=np.int64)
+
+
+@dataclass
+class BatchResult:
+    """Per-session, per-round arrays; rounds after a bust are zero bets."""
+
+    bets: np.ndarray
+    stakes: np.ndarray
+    limit_hits: np.ndarray
+    bust_round: np.ndarray
+
+
+def streak_before(flags: np.ndarray) -> np.ndarray:
+    """Length of the run of True values ending just before each round.
+
+    ``flags`` has shape (sessions, rounds). Round 0 always sees a streak of 0.
+    """
+    sessions, rounds = flags.shape
+    index = np.broadcast_to(np.arange(rounds), (sessions, rounds))
+    last_false = np.maximum.accumulate(np.where(flags, -1, index), axis=1)
+    streak_through = index - last_false
+    streak = np.zeros_like(streak_through)
+    streak[:, 1:] = streak_through[:, :-1]
+    return streak
+
+
+MAX_DOUBLINGS = 61
+"""Longest losing streak whose stage, and the stake swing it causes, fit in int64."""
+
+
+def martingale_bets(wins: np.ndarray, limit: Optional[int] = None) -> np.ndarray:
+    """The stage of BettingMartingale: doubles on each loss, reset to 1 on a win.
+
+    BettingMartingale's stage is an unbounded int, so a losing streak
+    longer than ``MAX_DOUBLINGS`` raises ``OverflowError`` rather than give
+    a different bet. With a ``limit``, stages above it are all placed at
+    the limit anyway, so the streak is capped there first.
+    """
+    losses = streak_before(~wins)
+    if limit is not None:
+        losses = np.minimum(losses, int(limit).bit_length())
+    if losses.size and losses.max() > MAX_DOUBLINGS:
+        raise OverflowError(f"A losing streak of {losses.max()} doubles the bet past int64")
+    return np.left_shift(1, losses).astype(np.int64)
+
+
+def one_three_two_six_bets(wins: np.ndarray) -> np.ndarray:
+    """The 1-3-2-6 cycle of OneThreeTwoSix: advances on a win, restarts on a loss."""
+    return ONE_THREE_TWO_SIX[streak_before(wins) % 4]
+
+
+def settle(
+        wins: np.ndarray,
+        bets: np.ndarray,
+        init_stake: Optional[int] = None,
+        limit: Optional[int] = None
+) -> BatchResult:
+    """Apply the table limit and the player's stake to the desired bets.
+
+    A bet over the limit is placed at the limit and counted as a limit hit.
+    A session busts on the first round its stake cannot cover the bet; it
+    places no further bets from that round on. Without ``init_stake`` the
+    player never busts and stakes are relative to zero.
+    """
+    sessions, rounds = wins.shape
+    if rounds == 0:
+        empty = np.zeros(wins.shape, dtype=np.int64)
+        return BatchResult(empty, empty.copy(), np.zeros(wins.shape, dtype=bool), np.full(sessions, -1, dtype=np.int64))
+    limit_hits = np.zeros(wins.shape, dtype=bool) if limit is None else bets > limit
+    placed = bets if limit is None else np.minimum(bets, limit)
+    outcome = np.where(wins, placed, -placed)
+
+    start = 0 if init_stake is None else init_stake
+    before = np.empty((sessions, rounds), dtype=np.int64)
+    before[:, 0] = start
+    before[:, 1:] = start + np.cumsum(outcome[:, :-1], axis=1)
+
+    bust_round = np.full(sessions, -1, dtype=np.int64)
+    if init_stake is not None:
+        short = before < placed
+        busted = short.any(axis=1)
+        bust_round[busted] = short[busted].argmax(axis=1)
+        playing = np.arange(rounds) < np.where(busted, bust_round, rounds)[:, None]
+        placed = np.where(playing, placed, 0)
+        limit_hits = limit_hits & playing
+        outcome = np.where(playing, outcome, 0)
+
+    stakes = start + np.cumsum(outcome, axis=1)
+    return BatchResult(placed, stakes, limit_hits, bust_round)
+
+
+def martingale(
+        wins: np.ndarray,
+        init_stake: Optional[int] = None,
+        limit: Optional[int] = None
+) -> BatchResult:
+    return settle(wins, martingale_bets(wins, limit), init_stake, limit)
+
+
+def one_three_two_six(
+        wins: np.ndarray,
+        init_stake: Optional[int] = None,
+        limit: Optional[int] = None
+) -> BatchResult:
+    return settle(wins, one_three_two_six_bets(wins), init_stake, limit)
+
+
+if __name__ == "__main__":
+    from SimplicityUsingCallables import BettingMartingale, BettingMartingale2
+
+    rng = np.random.default_rng(42)
+    outcomes = rng.random((1_000, 50)) < 0.48
+
+    for strategy_class in (BettingMartingale, BettingMartingale2):
+        expected = []
+        for session in outcomes:
+            strategy = strategy_class()
+            row = []
+            for won in session:
+                row.append(strategy())
+                if won:
+                    strategy.win += 1
+                else:
+                    strategy.loss += 1
+            expected.append(row)
+        assert (martingale_bets(outcomes) == np.array(expected)).all()
+
+    result = martingale(outcomes, init_stake=100, limit=50)
+    print("busted sessions:", (result.bust_round >= 0).sum())
+    print("limit hits:", result.limit_hits.sum())
+    print("mean final stake:", result.stakes[:, -1].mean())
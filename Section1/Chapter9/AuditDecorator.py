@@ -1,7 +1,11 @@
 import logging, sys
+import logging.handlers
+import copy
 import functools
+import queue
+import random
 from enum import Enum
-from typing import Callable, TypeVar, Any, cast
+from typing import Callable, TypeVar, Any, Optional, cast
 
 FuncType = Callable[..., Any]
 F = TypeVar("F", bound=FuncType)
@@ -20,26 +24,97 @@ class CardDC:
         self.suit = suit
 
 
-def audit(method: F) -> F:
-    @functools.wraps(method)
-    def wrapper(self, *args, **kwargs):
-        template = "%s\n    before %s\n     after %s"
-        audit_log = logging.getLogger("audit")
-        before = repr(self)
+class Snapshot:
+    """State of an object captured now, formatted only if a handler emits it.
 
+    A class can define ``__audit_state__()`` to supply a cheaper snapshot;
+    otherwise the object is shallow-copied along with its mutable containers.
+    """
+
+    __slots__ = ("_state",)
+
+    def __init__(self, obj: Any) -> None:
+        if hasattr(obj, "__audit_state__"):
+            self._state = obj.__audit_state__()
+            return
         try:
-            result = method(self, *args, **kwargs)
-        except Exception as e:
-            after = repr(self)
-            audit_log.exception(template, method.__qualname__, before, after)
-            raise
+            clone = copy.copy(obj)
+            for name, value in vars(clone).items():
+                if isinstance(value, (list, dict, set, bytearray)):
+                    setattr(clone, name, copy.copy(value))
+            self._state = clone
+        except TypeError:
+            self._state = repr(obj)
+
+    def __str__(self) -> str:
+        return self._state if isinstance(self._state, str) else repr(self._state)
+
+
+def audit(
+        method: Optional[F] = None,
+        *,
+        sample_rate: float = 1.0,
+        logger_name: str = "audit"
+) -> Any:
+    """Log state before and after each call to ``logger_name`` at INFO.
+
+    Use as ``@audit`` or ``@audit(sample_rate=0.01)``. Nothing is captured
+    when the logger would drop the record, and only ``sample_rate`` of the
+    calls are snapshotted. Failing calls are always recorded, with their
+    before state only if they were sampled.
+
+    Sampling draws from a private ``random.Random``, so auditing never
+    advances the global generator that seeded simulations shuffle with.
+    """
+    audit_log = logging.getLogger(logger_name)
+    sampler = random.Random()
+    template = "%s\n    before %s\n     after %s"
+
+    def concrete_decorator(method: F) -> F:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not audit_log.isEnabledFor(logging.ERROR):
+                return method(self, *args, **kwargs)
+            sampled = (
+                    audit_log.isEnabledFor(logging.INFO)
+                    and (sample_rate >= 1.0 or sampler.random() < sample_rate)
+            )
+            before = Snapshot(self) if sampled else "(not sampled)"
+
+            try:
+                result = method(self, *args, **kwargs)
+            except Exception as e:
+                audit_log.exception(template, method.__qualname__, before, Snapshot(self))
+                raise
+
+            if sampled:
+                audit_log.info(template, method.__qualname__, before, Snapshot(self))
+
+            return result
+
+        return cast(F, wrapper)
+
+    if method is not None:
+        return concrete_decorator(method)
+    return concrete_decorator
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records untouched so snapshots are formatted on the listener thread."""
 
-        after = repr(self)
-        audit_log.info(template, method.__qualname__, before, after)
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
-        return result
 
-    return cast(F, wrapper)
+def start_async_audit(*handlers: logging.Handler, logger_name: str = "audit") -> logging.handlers.QueueListener:
+    """Route the audit logger through an in-process queue; call ``stop()`` at shutdown."""
+    audit_queue: queue.SimpleQueue = queue.SimpleQueue()
+    audit_log = logging.getLogger(logger_name)
+    audit_log.addHandler(DeferredQueueHandler(audit_queue))
+    audit_log.propagate = False
+    listener = logging.handlers.QueueListener(audit_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
 
 
 class Hand:
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Type
+from typing import Any, Optional, Sequence, Type
 
 
 class UglyClass1:
@@ -39,8 +39,16 @@ class SomeClass:
 
 
 class LoggedWithHook:
-    def __init_subclass__(cls, name=None):
-        cls.logger = logging.getLogger(name or cls.__qualname__)
+    def __init_subclass__(
+            cls,
+            name=None,
+            filters: Sequence[logging.Filter] = (),
+            adapter: Optional[Type[logging.LoggerAdapter]] = None
+    ):
+        logger = logging.getLogger(name or cls.__qualname__)
+        for log_filter in filters:
+            logger.addFilter(log_filter)
+        cls.logger = adapter(logger, {}) if adapter else logger
 
 
 class SomeClass4(LoggedWithHook):
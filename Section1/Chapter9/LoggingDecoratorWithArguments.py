@@ -1,20 +1,52 @@
 import logging, sys
 import functools
+import reprlib
+import threading
+import time
 from typing import Callable, TypeVar, Any, cast
 
 FuncType = Callable[..., Any]
 F = TypeVar("F", bound=FuncType)
 
+summary = reprlib.Repr()
+summary.maxstring = 40
+summary.maxother = 40
+
 
 def debug_named(log_name: str) -> Callable[[F], F]:
+    """Trace calls at DEBUG with call depth, duration and argument summaries.
+
+    When the logger is not enabled for DEBUG the wrapper is a single cached
+    level check and a direct call. ``Logger.isEnabledFor`` caches its answer
+    and the cache is cleared whenever a level changes, so enabling tracing
+    later takes effect on the next call.
+    """
     log = logging.getLogger(log_name)
+    is_enabled_for = log.isEnabledFor
+    local = threading.local()
 
     def concrete_decorator(function: F) -> F:
+        name = function.__qualname__
+
         @functools.wraps(function)
         def wrapped(*args, **kwargs):
-            log.debug("%s(%r, %r)", function.__name__, args, kwargs)
-            result = function(args, kwargs)
-            log.debug("%s = %r", function.__name__, result)
+            if not is_enabled_for(logging.DEBUG):
+                return function(*args, **kwargs)
+
+            depth = getattr(local, "depth", 0)
+            local.depth = depth + 1
+            log.debug(
+                "%s%s(%s)", "  " * depth, name,
+                ", ".join([*map(summary.repr, args), *(f"{k}={summary.repr(v)}" for k, v in kwargs.items())])
+            )
+            start = time.perf_counter()
+            try:
+                result = function(*args, **kwargs)
+            finally:
+                local.depth = depth
+            log.debug(
+                "%s%s = %s [%.6fs]", "  " * depth, name, summary.repr(result), time.perf_counter() - start
+            )
 
             return result
 
@@ -29,9 +61,13 @@ if __name__ == "__main__":
     def ackermann3(m: int, n: int) -> int:
         if m == 0:
             return n + 1
-        elif m > 0 and n > 0:
+        elif m > 0 and n == 0:
             return ackermann3(m - 1, 1)
         elif m > 0 and n > 0:
             return ackermann3(m - 1, ackermann3(m, n - 1))
         else:
             raise Exception(f"Design Error: {vars()}")
+
+    print(ackermann3(2, 3))
+    logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
+    print(ackermann3(1, 1))
@@ -6,18 +6,20 @@ from Post import Post
 
 
 class Access:
+    shelf_open = staticmethod(shelve.open)
+
     def __init__(self) -> None:
         self.database: shelve.Shelf = cast(shelve.Shelf, None)
         self.max: Dict[str, int] = {"Post": 0, "Blog": 0}
 
     def new(self, path: Path) -> None:
-        self.database = shelve.Shelf = shelve.open(str(path), "n")
+        self.database = self.shelf_open(str(path), "n")
         self.max: Dict[str, int] = {"Post": 0, "Blog": 0}
 
         self.sync()
 
     def open(self, path: Path) -> None:
-        self.database = shelve.open(str(path), "n")
+        self.database = self.shelf_open(str(path), "w")
         self.max = self.database["_DB:max"]
 
     def close(self) -> None:
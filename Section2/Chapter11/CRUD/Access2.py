@@ -18,9 +18,10 @@ class Access2(Access):
         super().delete_post(post)
 
         # Update the index.
-        index_list = self.database[post._blog_id]
+        blog_index = f"_Index:{post._blog_id}"
+        index_list = self.database[blog_index]
         index_list.remove(post._id)
-        self.database[post._blog_id] = index_list
+        self.database[blog_index] = index_list
 
     def post_iter(self, blog: Blog) -> Iterator[Post]:
         blog_index = f"_Index:{blog._id}"
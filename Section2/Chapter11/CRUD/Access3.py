@@ -5,7 +5,7 @@ from typing import Iterator
 
 class Access3(Access2):
     def new(self, path: Path) -> None:
-        super().new(Path)
+        super().new(path)
         self.database["_Index:Blog"] = list()
 
     def create_blog(self, blog: Blog) -> Blog:
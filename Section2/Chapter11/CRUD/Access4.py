@@ -1,10 +1,11 @@
-from Access3 import Access
+from Access3 import Access3
 from pathlib import Path
 
 
 class Access4(Access3):
     def new(self, path: Path) -> None:
-        super().new(Path)
+        super().new(path)
+        self.database["_Index:Blog_Title"] = dict()
 
     def create_blog(self, blog):
         super().create_blog(blog)
@@ -0,0 +1,176 @@
+import pickle
+import shelve
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, MutableMapping
+
+from Access import Access
+from IndexedAccess import IndexedAccess
+
+DELETED = object()
+
+
+class CachedShelf(MutableMapping[str, Any]):
+    """An LRU of pickled values in front of a shelf, with batched write-back.
+
+    Writes only mark a key dirty. Dirty keys are written to the shelf
+    together once ``max_dirty`` have accumulated, when ``flush_interval``
+    seconds have passed since the last flush, on ``sync()`` or on
+    ``close()``. With ``write_back=False`` the cache is read-through only
+    and every write goes straight to the shelf.
+
+    The cache holds the pickled bytes, not the objects: a hit skips the
+    dbm read but still unpickles, so every read returns an independent
+    object, exactly as the shelf would, and a write captures the value as
+    it was at the time of the call. The bytes go straight to the shelf's
+    underlying mapping, so the shelf must not be opened with ``writeback``.
+    """
+
+    def __init__(
+            self,
+            shelf: shelve.Shelf,
+            cache_size: int = 1024,
+            max_dirty: int = 256,
+            flush_interval: float = 5.0,
+            write_back: bool = True
+    ) -> None:
+        self.shelf = shelf
+        self.cache_size = cache_size
+        self.max_dirty = max_dirty
+        self.flush_interval = flush_interval
+        self.write_back = write_back
+        self.cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self.dirty: Dict[str, Any] = {}
+        self.last_flush = time.monotonic()
+        self.stats = {"hits": 0, "misses": 0, "flushes": 0, "written": 0}
+
+    def _raw_key(self, key: str) -> bytes:
+        return key.encode(self.shelf.keyencoding)
+
+    def _remember(self, key: str, data: bytes) -> None:
+        self.cache[key] = data
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.cache_size:
+            old_key, _ = self.cache.popitem(last=False)
+            if old_key in self.dirty:
+                self.shelf.dict[self._raw_key(old_key)] = self.dirty.pop(old_key)
+                self.stats["written"] += 1
+
+    def _maybe_flush(self) -> None:
+        if len(self.dirty) >= self.max_dirty or time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.dirty and self.dirty[key] is DELETED:
+            raise KeyError(key)
+        if key in self.cache:
+            self.stats["hits"] += 1
+            self.cache.move_to_end(key)
+            data = self.cache[key]
+        else:
+            self.stats["misses"] += 1
+            try:
+                data = self.shelf.dict[self._raw_key(key)]
+            except KeyError:
+                raise KeyError(key) from None
+            self._remember(key, data)
+        return pickle.loads(data)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        data = pickle.dumps(value, pickle.DEFAULT_PROTOCOL)
+        if self.write_back:
+            self.dirty[key] = data
+            self._remember(key, data)
+            self._maybe_flush()
+        else:
+            self.shelf.dict[self._raw_key(key)] = data
+            self._remember(key, data)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self.cache.pop(key, None)
+        if self.write_back:
+            self.dirty[key] = DELETED
+            self._maybe_flush()
+        else:
+            del self.shelf[key]
+
+    def __contains__(self, key: object) -> bool:
+        if key in self.dirty:
+            return self.dirty[key] is not DELETED
+        return key in self.cache or key in self.shelf
+
+    def __iter__(self) -> Iterator[str]:
+        self.flush()
+        return iter(list(self.shelf))
+
+    def __len__(self) -> int:
+        self.flush()
+        return len(self.shelf)
+
+    def __bool__(self) -> bool:
+        return True
+
+    def flush(self) -> None:
+        """Write every dirty key to the shelf in one batch."""
+        for key, data in self.dirty.items():
+            if data is DELETED:
+                if key in self.shelf:
+                    del self.shelf[key]
+            else:
+                self.shelf.dict[self._raw_key(key)] = data
+        self.stats["written"] += len(self.dirty)
+        self.stats["flushes"] += 1
+        self.dirty.clear()
+        self.last_flush = time.monotonic()
+
+    def sync(self) -> None:
+        self.flush()
+        self.shelf.sync()
+
+    def close(self) -> None:
+        self.flush()
+        self.shelf.close()
+        self.cache.clear()
+
+
+class CachedAccess(Access):
+    """Access with a ``CachedShelf`` in front of the database.
+
+    ``_DB:max`` is only rewritten by ``sync()`` when a counter has changed.
+    """
+
+    def __init__(
+            self,
+            cache_size: int = 1024,
+            max_dirty: int = 256,
+            flush_interval: float = 5.0,
+            write_back: bool = True
+    ) -> None:
+        super().__init__()
+        self.options = dict(
+            cache_size=cache_size, max_dirty=max_dirty, flush_interval=flush_interval, write_back=write_back
+        )
+        self.synced_max: Dict[str, int] = {}
+
+    def new(self, path: Path) -> None:
+        super().new(path)
+        self.database = CachedShelf(self.database, **self.options)  # type: ignore
+        self.synced_max = dict(self.max)
+
+    def open(self, path: Path) -> None:
+        super().open(path)
+        self.database = CachedShelf(self.database, **self.options)  # type: ignore
+        self.synced_max = dict(self.max)
+
+    def sync(self) -> None:
+        if self.max != self.synced_max:
+            self.database["_DB:max"] = dict(self.max)
+            self.synced_max = dict(self.max)
+        self.database.sync()
+
+
+class CachedIndexedAccess(CachedAccess, IndexedAccess):
+    """Indexed access whose index chunks and posts share the same cache."""
@@ -0,0 +1,112 @@
+import dbm
+import lzma
+import shelve
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, MutableMapping, Optional, Tuple, Union
+
+from Access import Access
+
+# A tagged value starts with a NUL byte, which never starts a pickle, then its codec tag.
+MARK = b"\x00"
+CODECS: Dict[bytes, Tuple[str, Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    b"z": ("zlib", lambda data: zlib.compress(data, 6), zlib.decompress),
+    b"x": ("lzma", lambda data: lzma.compress(data, preset=6), lzma.decompress),
+}
+TAGS = {name: tag for tag, (name, _, _) in CODECS.items()}
+
+
+class CompressedDict(MutableMapping[bytes, bytes]):
+    """Compresses the pickled values of a shelf's underlying dbm mapping.
+
+    Values of at least ``threshold`` bytes are stored as ``NUL, tag,
+    compressed bytes`` when that is smaller. Anything without the NUL
+    mark is an ordinary pickle, so databases written without compression
+    stay readable and can be converted one value at a time.
+    """
+
+    def __init__(self, store: MutableMapping[bytes, bytes], codec: str = "zlib", threshold: int = 256) -> None:
+        self.store = store
+        self.tag = TAGS[codec]
+        self.threshold = threshold
+        self.stats = {
+            "values": 0, "compressed": 0, "raw_bytes": 0, "stored_bytes": 0,
+            "encode_ns": 0, "decode_ns": 0, "decoded": 0,
+        }
+
+    @property
+    def ratio(self) -> float:
+        """Stored bytes over pickled bytes for every value written so far."""
+        return self.stats["stored_bytes"] / self.stats["raw_bytes"] if self.stats["raw_bytes"] else 1.0
+
+    def encode(self, data: bytes) -> bytes:
+        value = data
+        if len(data) >= self.threshold:
+            start = time.perf_counter_ns()
+            packed = MARK + self.tag + CODECS[self.tag][1](data)
+            self.stats["encode_ns"] += time.perf_counter_ns() - start
+            if len(packed) < len(data):
+                value = packed
+                self.stats["compressed"] += 1
+        self.stats["values"] += 1
+        self.stats["raw_bytes"] += len(data)
+        self.stats["stored_bytes"] += len(value)
+        return value
+
+    def decode(self, value: bytes) -> bytes:
+        if value[:1] != MARK:
+            return value
+        start = time.perf_counter_ns()
+        data = CODECS[value[1:2]][2](value[2:])
+        self.stats["decode_ns"] += time.perf_counter_ns() - start
+        self.stats["decoded"] += 1
+        return data
+
+    def __getitem__(self, key: bytes) -> bytes:
+        return self.decode(self.store[key])
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        self.store[key] = self.encode(value)
+
+    def __delitem__(self, key: bytes) -> None:
+        del self.store[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.store
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self.store.keys())
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def sync(self) -> None:
+        if hasattr(self.store, "sync"):
+            self.store.sync()
+
+    def close(self) -> None:
+        self.store.close()  # type: ignore
+
+
+def open(
+        filename: Union[str, Path],
+        flag: str = "c",
+        protocol: Optional[int] = None,
+        writeback: bool = False,
+        codec: str = "zlib",
+        threshold: int = 256
+) -> shelve.Shelf:
+    """Like ``shelve.open()``, with values compressed by ``codec``, either ``"zlib"`` or ``"lzma"``."""
+    store = CompressedDict(dbm.open(str(filename), flag), codec, threshold)  # type: ignore
+    return shelve.Shelf(store, protocol, writeback)  # type: ignore
+
+
+class CompressedAccess(Access):
+    """Access whose posts and blogs are stored compressed; see ``compression_stats()``."""
+
+    shelf_open = staticmethod(open)
+
+    def compression_stats(self) -> Dict[str, Any]:
+        store: CompressedDict = self.database.dict  # type: ignore
+        return {**store.stats, "ratio": store.ratio}
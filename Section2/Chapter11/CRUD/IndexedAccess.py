@@ -0,0 +1,121 @@
+import shelve
+from typing import Iterator, List, Optional
+
+from Access import Access
+from Blog import Blog
+from Post import Post
+
+
+class ChunkedIndex:
+    """A list of keys stored as fixed-size chunks in the shelf.
+
+    The header record ``name`` holds the number of chunks; chunk ``n`` is
+    stored under ``_Chunk:{n}:{name}``. Appending rewrites only the last
+    chunk, so growing an index costs O(chunk_size), not O(len(index)).
+    Removal leaves a short chunk behind rather than shifting later ones.
+    """
+
+    def __init__(self, database: shelve.Shelf, name: str, chunk_size: int = 256) -> None:
+        self.database = database
+        self.name = name
+        self.chunk_size = chunk_size
+
+    def _chunk_key(self, n: int) -> str:
+        return f"_Chunk:{n}:{self.name}"
+
+    def chunks(self) -> int:
+        return self.database.get(self.name, 0)
+
+    def append(self, key: str) -> None:
+        count = self.chunks()
+        last: List[str] = self.database[self._chunk_key(count - 1)] if count else []
+        if not count or len(last) >= self.chunk_size:
+            self.database[self._chunk_key(count)] = [key]
+            self.database[self.name] = count + 1
+        else:
+            self.database[self._chunk_key(count - 1)] = last + [key]
+
+    def remove(self, key: str) -> None:
+        for n in range(self.chunks()):
+            chunk: List[str] = self.database[self._chunk_key(n)]
+            if key in chunk:
+                chunk.remove(key)
+                self.database[self._chunk_key(n)] = chunk
+                return
+        raise KeyError(key)
+
+    def clear(self) -> None:
+        for n in range(self.chunks()):
+            del self.database[self._chunk_key(n)]
+        if self.name in self.database:
+            del self.database[self.name]
+
+    def __iter__(self) -> Iterator[str]:
+        for n in range(self.chunks()):
+            yield from self.database[self._chunk_key(n)]
+
+
+class IndexedAccess(Access):
+    """Maintains blog→post and (blog, title)→post secondary indexes.
+
+    ``post_iter()`` and ``post_title_iter()`` read the index chunks and then
+    unpickle only the matching posts. Use ``rebuild_indexes()`` once on a
+    database that was written by plain ``Access``.
+    """
+
+    chunk_size = 256
+
+    def posts_index(self, blog_id: str) -> ChunkedIndex:
+        return ChunkedIndex(self.database, f"_Posts:{blog_id}", self.chunk_size)
+
+    def title_index(self, blog_id: str, title: str) -> ChunkedIndex:
+        return ChunkedIndex(self.database, f"_Title:{blog_id}:{title}", self.chunk_size)
+
+    def _index(self, post: Post, old: Optional[Post] = None) -> None:
+        if old is None or old._blog_id != post._blog_id:
+            self.posts_index(post._blog_id).append(post._id)
+        if old is None or (old._blog_id, old.title) != (post._blog_id, post.title):
+            self.title_index(post._blog_id, post.title).append(post._id)
+
+    def _unindex(self, post: Post, new: Optional[Post] = None) -> None:
+        if new is None or new._blog_id != post._blog_id:
+            self.posts_index(post._blog_id).remove(post._id)
+        if new is None or (new._blog_id, new.title) != (post._blog_id, post.title):
+            self.title_index(post._blog_id, post.title).remove(post._id)
+
+    def create_post(self, blog: Blog, post: Post) -> Post:
+        super().create_post(blog, post)
+        self._index(post)
+        return post
+
+    def update_post(self, post: Post) -> Post:
+        # The stored copy has the indexed values; the caller's may have changed.
+        old: Post = self.database[post._id]
+        super().update_post(post)
+        self._unindex(old, post)
+        self._index(post, old)
+        return post
+
+    def delete_post(self, post: Post) -> None:
+        old: Post = self.database[post._id]
+        super().delete_post(post)
+        self._unindex(old)
+
+    def post_keys(self, blog: Blog) -> Iterator[str]:
+        return iter(self.posts_index(blog._id))
+
+    def post_iter(self, blog: Blog) -> Iterator[Post]:
+        for k in self.post_keys(blog):
+            yield self.database[k]
+
+    def post_title_iter(self, blog: Blog, title: str) -> Iterator[Post]:
+        for k in self.title_index(blog._id, title):
+            yield self.database[k]
+
+    def rebuild_indexes(self) -> None:
+        """Drop every index record and re-index the stored posts with one full scan."""
+        for k in list(self.database):
+            if k.startswith(("_Posts:", "_Title:", "_Chunk:")):
+                del self.database[k]
+        for k in sorted((k for k in self.database if k.startswith("Post:")), key=lambda k: int(k[5:])):
+            self._index(self.database[k])
@@ -0,0 +1,151 @@
+import fcntl
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import ContextManager, Iterator, Optional
+
+from Access import Access
+
+
+class LockTimeout(TimeoutError):
+    pass
+
+
+class ShelfLock:
+    """A reader/writer lock shared between processes through ``fcntl.flock``.
+
+    The lock lives on a sidecar ``<shelf>.lock`` file, never on the shelf's
+    own files, so it works for every dbm flavour and for SQLite. Each
+    acquisition opens its own descriptor: a process that nests a shared
+    lock inside its own exclusive lock waits on itself until the timeout.
+    """
+
+    def __init__(self, path: Path, timeout: float = 10.0, poll: float = 0.005) -> None:
+        self.path = path.with_name(f"{path.name}.lock")
+        self.timeout = timeout
+        self.poll = poll
+
+    @contextmanager
+    def acquire(self, exclusive: bool) -> Iterator[None]:
+        mode = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = time.monotonic() + self.timeout
+        try:
+            while True:
+                try:
+                    fcntl.flock(fd, mode | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        kind = "exclusive" if exclusive else "shared"
+                        raise LockTimeout(f"No {kind} lock on {self.path} after {self.timeout}s")
+                    time.sleep(self.poll)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def shared(self) -> ContextManager[None]:
+        return self.acquire(exclusive=False)
+
+    def exclusive(self) -> ContextManager[None]:
+        return self.acquire(exclusive=True)
+
+
+class LockedAccess(Access):
+    """Access that several processes can use on one shelf at the same time.
+
+    The shelf is only open inside a ``reading()``, ``writing()`` or
+    ``snapshot()`` block. Readers share the lock. A writer holds it
+    exclusively and reloads ``_DB:max`` on entry, so keys allocated by other
+    processes are never reused. ``snapshot()`` holds the shared lock only
+    long enough to copy the shelf, then reads the copy, so a long scan
+    does not keep writers out. A SQLite shelf is copied with the SQLite
+    backup API, because copying its main, ``-wal`` and ``-shm`` files is not
+    a consistent snapshot.
+    """
+
+    def __init__(self, timeout: float = 10.0) -> None:
+        super().__init__()
+        self.timeout = timeout
+        self.path: Optional[Path] = None
+        self.lock: Optional[ShelfLock] = None
+
+    def new(self, path: Path) -> None:
+        self.path, self.lock = path, ShelfLock(path, self.timeout)
+        with self.lock.exclusive():
+            super().new(path)
+            super().close()
+
+    def open(self, path: Path) -> None:
+        self.path, self.lock = path, ShelfLock(path, self.timeout)
+
+    def close(self) -> None:
+        if self.database is not None:
+            super().close()
+
+    def _files(self) -> Iterator[Path]:
+        assert self.path and self.lock
+        return (p for p in self.path.parent.glob(f"{self.path.name}*") if p != self.lock.path and p.is_file())
+
+    def _copy(self, target: Path) -> None:
+        assert self.path
+        if self.path.is_file():
+            with self.path.open("rb") as source:
+                is_sqlite = source.read(16) == b"SQLite format 3\x00"
+            if is_sqlite:
+                source_db = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+                target_db = sqlite3.connect(str(target))
+                try:
+                    source_db.backup(target_db)
+                finally:
+                    target_db.close()
+                    source_db.close()
+                return
+        for source in self._files():
+            shutil.copy2(source, target.with_name(source.name))
+
+    @contextmanager
+    def reading(self) -> Iterator["LockedAccess"]:
+        assert self.path and self.lock
+        with self.lock.shared():
+            self.database = self.shelf_open(str(self.path), "r")
+            try:
+                self.max = self.database["_DB:max"]
+                yield self
+            finally:
+                self.database.close()
+                self.database = None  # type: ignore
+
+    @contextmanager
+    def writing(self) -> Iterator["LockedAccess"]:
+        assert self.path and self.lock
+        with self.lock.exclusive():
+            super().open(self.path)
+            try:
+                yield self
+            finally:
+                super().close()
+
+    @contextmanager
+    def snapshot(self) -> Iterator["LockedAccess"]:
+        assert self.path and self.lock
+        directory = Path(tempfile.mkdtemp(prefix="shelf-snapshot-"))
+        try:
+            with self.lock.shared():
+                self._copy(directory / self.path.name)
+            self.database = self.shelf_open(str(directory / self.path.name), "r")
+            try:
+                self.max = self.database["_DB:max"]
+                yield self
+            finally:
+                self.database.close()
+                self.database = None  # type: ignore
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
@@ -0,0 +1,201 @@
+import pickle
+import shelve
+import sqlite3
+from contextlib import contextmanager
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Iterator, List, MutableMapping, Optional, Tuple, Union
+
+from Access import Access
+from Blog import Blog
+from Post import Post
+
+
+def prefix_end(prefix: bytes) -> Optional[bytes]:
+    """The smallest key greater than every key starting with ``prefix``."""
+    stripped = prefix.rstrip(b"\xff")
+    if not stripped:
+        return None
+    return stripped[:-1] + bytes([stripped[-1] + 1])
+
+
+class SQLiteDict(MutableMapping[bytes, bytes]):
+    """The bytes-to-bytes mapping under a shelf, kept in key order by SQLite.
+
+    Each write outside ``batch()`` commits on its own, like a dbm file.
+    The database uses WAL mode, so readers in other processes are not
+    blocked by a writer.
+    """
+
+    def __init__(self, filename: Union[str, Path], flag: str = "c") -> None:
+        self.depth = 0
+        if flag == "r":
+            self.connection = sqlite3.connect(f"{Path(filename).resolve().as_uri()}?mode=ro", uri=True)
+        else:
+            if flag == "w" and not Path(filename).exists():
+                raise FileNotFoundError(filename)
+            self.connection = sqlite3.connect(str(filename))
+        self.connection.isolation_level = None
+        if flag != "r":
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS shelf (key BLOB PRIMARY KEY, value BLOB NOT NULL) WITHOUT ROWID"
+            )
+            if flag == "n":
+                self.connection.execute("DELETE FROM shelf")
+
+    def __getitem__(self, key: bytes) -> bytes:
+        row = self.connection.execute("SELECT value FROM shelf WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return row[0]
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        self.connection.execute("INSERT OR REPLACE INTO shelf (key, value) VALUES (?, ?)", (key, value))
+
+    def __delitem__(self, key: bytes) -> None:
+        if self.connection.execute("DELETE FROM shelf WHERE key = ?", (key,)).rowcount == 0:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return self.connection.execute("SELECT 1 FROM shelf WHERE key = ?", (key,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[bytes]:
+        return (key for key, in self.connection.execute("SELECT key FROM shelf ORDER BY key").fetchall())
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT count(*) FROM shelf").fetchone()[0]
+
+    def range(self, start: bytes = b"", stop: Optional[bytes] = None, values: bool = True) -> List[Tuple[bytes, bytes]]:
+        """Rows with ``start <= key < stop`` in key order, found with a primary-key seek."""
+        columns = "key, value" if values else "key, NULL"
+        if stop is None:
+            query, params = f"SELECT {columns} FROM shelf WHERE key >= ? ORDER BY key", (start,)
+        else:
+            query, params = f"SELECT {columns} FROM shelf WHERE key >= ? AND key < ? ORDER BY key", (start, stop)
+        return self.connection.execute(query, params).fetchall()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Apply every write in the block as one transaction, or none of them.
+
+        Nested blocks join the outermost one, which alone commits.
+        """
+        if not self.depth:
+            self.connection.execute("BEGIN IMMEDIATE")
+        self.depth += 1
+        try:
+            yield
+        except BaseException:
+            self.depth -= 1
+            if not self.depth:
+                self.connection.execute("ROLLBACK")
+            raise
+        self.depth -= 1
+        if not self.depth:
+            self.connection.execute("COMMIT")
+
+    def sync(self) -> None:
+        """Commit pending writes, except inside ``batch()``, which commits on exit."""
+        if not self.depth and self.connection.in_transaction:
+            self.connection.execute("COMMIT")
+
+    def close(self) -> None:
+        self.sync()
+        self.connection.close()
+
+
+class SQLiteShelf(shelve.Shelf):
+    """A ``shelve.Shelf`` with ordered keys and prefix and range scans.
+
+    ``keys(prefix="Post:")`` and ``items(prefix="Post:")`` cost O(matches),
+    not O(database), because they seek in the primary-key index.
+    """
+
+    dict: SQLiteDict
+
+    def __init__(
+            self,
+            filename: Union[str, Path],
+            flag: str = "c",
+            protocol: Optional[int] = None,
+            writeback: bool = False
+    ) -> None:
+        super().__init__(SQLiteDict(filename, flag), protocol, writeback)  # type: ignore
+
+    def _load(self, key: str, raw: bytes) -> Any:
+        if key in self.cache:
+            return self.cache[key]
+        value = pickle.Unpickler(BytesIO(raw)).load()
+        if self.writeback:
+            self.cache[key] = value
+        return value
+
+    def _range(self, start: str, stop: Optional[str], prefix: str, values: bool) -> List[Tuple[str, bytes]]:
+        if self.writeback:
+            # Pending cached writes must be visible to the scan.
+            self.sync()
+        if prefix:
+            low = prefix.encode(self.keyencoding)
+            rows = self.dict.range(low, prefix_end(low), values)
+        else:
+            high = None if stop is None else stop.encode(self.keyencoding)
+            rows = self.dict.range(start.encode(self.keyencoding), high, values)
+        return [(k.decode(self.keyencoding), v) for k, v in rows]
+
+    def keys(self, prefix: str = "") -> Any:  # type: ignore
+        if not prefix:
+            return super().keys()
+        return [k for k, _ in self._range("", None, prefix, values=False)]
+
+    def items(self, prefix: str = "") -> Any:  # type: ignore
+        if not prefix:
+            return super().items()
+        return [(k, self._load(k, v)) for k, v in self._range("", None, prefix, values=True)]
+
+    def range(self, start: str = "", stop: Optional[str] = None) -> Iterator[Tuple[str, Any]]:
+        """(key, value) pairs with ``start <= key < stop`` in key order."""
+        return ((k, self._load(k, v)) for k, v in self._range(start, stop, "", values=True))
+
+    @contextmanager
+    def batch(self) -> Iterator["SQLiteShelf"]:
+        """One transaction; with ``writeback`` the cache is written inside it and dropped on rollback."""
+        outermost = not self.dict.depth
+        if self.writeback and outermost:
+            # Writes cached before the batch are not part of it.
+            super().sync()
+        try:
+            with self.dict.batch():
+                yield self
+                if self.writeback and outermost:
+                    super().sync()
+        except BaseException:
+            if self.writeback and outermost:
+                self.cache.clear()
+            raise
+
+
+def open(
+        filename: Union[str, Path],
+        flag: str = "c",
+        protocol: Optional[int] = None,
+        writeback: bool = False
+) -> SQLiteShelf:
+    """Like ``shelve.open()``; ``flag`` is one of ``"r"``, ``"w"``, ``"c"`` or ``"n"``."""
+    return SQLiteShelf(filename, flag, protocol, writeback)
+
+
+class SQLiteAccess(Access):
+    """Access on a SQLite shelf, where blog and post scans read only their own keys.
+
+    Any other Access class runs on SQLite by setting ``shelf_open`` the same way.
+    """
+
+    shelf_open = staticmethod(open)
+
+    def blog_iter(self) -> Iterator[Blog]:
+        return (blog for _, blog in self.database.items(prefix="Blog:"))
+
+    def post_iter(self, blog: Blog) -> Iterator[Post]:
+        return (post for _, post in self.database.items(prefix="Post:") if post._blog_id == blog._id)
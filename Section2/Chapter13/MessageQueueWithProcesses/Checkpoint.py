@@ -0,0 +1,108 @@
+import enum
+import os
+import pickle
+import types
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+
+@dataclass
+class Statistics:
+    """Running totals of the numeric columns of each result sample."""
+
+    count: int = 0
+    totals: List[float] = field(default_factory=list)
+    squares: List[float] = field(default_factory=list)
+
+    def add(self, sample: Tuple) -> None:
+        values = [v for v in sample if isinstance(v, (int, float))]
+        if not self.totals:
+            self.totals = [0.0] * len(values)
+            self.squares = [0.0] * len(values)
+        for i, v in enumerate(values):
+            self.totals[i] += v
+            self.squares[i] += v * v
+        self.count += 1
+
+    def means(self) -> List[float]:
+        return [t / self.count for t in self.totals] if self.count else []
+
+
+@dataclass
+class Checkpoint:
+    """Everything needed to continue a run without redoing finished chunks.
+
+    No RNG state is kept: each chunk reseeds its worker from ``chunk_seed``.
+    """
+
+    seed: int
+    statistics: Dict[str, Statistics] = field(default_factory=dict)
+    completed: Set[int] = field(default_factory=set)
+
+    def record(self, chunk_id: int, key: str, sample: Tuple) -> None:
+        self.statistics.setdefault(key, Statistics()).add(sample)
+        self.completed.add(chunk_id)
+
+    def save(self, path: Path) -> None:
+        """Write to a sibling temporary file, then atomically replace."""
+        temp = path.with_name(f".{path.name}.tmp")
+        with temp.open("wb") as target:
+            pickle.dump(self, target, protocol=pickle.HIGHEST_PROTOCOL)
+            target.flush()
+            os.fsync(target.fileno())
+        os.replace(temp, path)
+
+    @staticmethod
+    def load(path: Path) -> "Checkpoint":
+        with path.open("rb") as source:
+            return pickle.load(source)
+
+
+def config_key(obj: Any) -> str:
+    """A name for a configuration that is the same in every process and run.
+
+    Containers are named item by item, and objects by class and
+    attributes, because the default ``repr()`` embeds an address that
+    differs for every unpickled copy. These are the same rules
+    Chapter 14's ``ResultCache.canonical()`` uses. Anything that can't be
+    named this way raises ``TypeError``.
+
+    >>> config_key([frozenset({2, 1}), {"b": None, "a": (1.5,)}])
+    "[frozenset({1, 2}), {'a': (1.5,), 'b': None}]"
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str, bytes, enum.Enum)):
+        return repr(obj)
+    if isinstance(obj, list):
+        return f"[{', '.join(config_key(item) for item in obj)}]"
+    if isinstance(obj, tuple):
+        items = [config_key(item) for item in obj]
+        return f"({items[0]},)" if len(items) == 1 else f"({', '.join(items)})"
+    if isinstance(obj, (set, frozenset)):
+        return f"{type(obj).__name__}({{{', '.join(sorted(config_key(item) for item in obj))}}})"
+    if isinstance(obj, dict):
+        items = sorted((config_key(k), config_key(v)) for k, v in obj.items())
+        return f"{{{', '.join(f'{k}: {v}' for k, v in items)}}}"
+    if isinstance(obj, (type, types.FunctionType, types.BuiltinFunctionType)):
+        return qualified_name(obj)
+    slots = [
+        name for cls in type(obj).__mro__ for name in getattr(cls, "__slots__", ())
+        if name not in ("__dict__", "__weakref__") and hasattr(obj, name)
+    ]
+    if hasattr(obj, "__dict__") or slots:
+        state = {name: getattr(obj, name) for name in slots}
+        state.update(getattr(obj, "__dict__", {}))
+        fields = ", ".join(f"{k}={config_key(v)}" for k, v in sorted(state.items()))
+        return f"{qualified_name(type(obj))}({fields})"
+    raise TypeError(f"No stable key for {type(obj).__qualname__} {obj!r}")
+
+
+def qualified_name(obj: Any) -> str:
+    if "<" in obj.__qualname__:
+        raise TypeError(f"No stable key for {type(obj).__name__} {obj.__qualname__}")
+    return f"{obj.__module__}.{obj.__qualname__}"
+
+
+def chunk_seed(seed: int, chunk_id: int) -> str:
+    """Each chunk gets its own RNG stream, so any chunk can be replayed alone."""
+    return f"{seed}:{chunk_id}"
@@ -1,5 +1,7 @@
 import multiprocessing
+import random
 from Simulate import Simulate
+from Checkpoint import chunk_seed
 
 
 class Simulation(multiprocessing.Process):
@@ -18,10 +20,11 @@ class Simulation(multiprocessing.Process):
         item = self.setup_queue.get()
 
         while item != (None, None):
-            table, player = item
+            chunk_id, seed, table, player = item
+            random.seed(chunk_seed(seed, chunk_id))
             self.sim = Simulate(table, player, samples=1)
             results = list(self.sim)
-            self.result_queue.put((table, player, results[0]))
+            self.result_queue.put((chunk_id, table, player, results[0]))
             item = self.setup_queue.get()
 
         print(f"{self.__class__.__name__} finish")
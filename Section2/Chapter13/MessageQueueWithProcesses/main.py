@@ -0,0 +1,62 @@
+import argparse
+import multiprocessing
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from Checkpoint import Checkpoint, config_key
+from Simulate import Player, Table
+from Simulation import Simulation
+
+
+def get_options() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--checkpoint", type=Path, default=Path("simulation.ckpt"))
+    parser.add_argument("--interval", type=float, default=30.0, help="Seconds between checkpoints")
+    parser.add_argument("--resume", action="store_true")
+    return parser.parse_args()
+
+
+def main(options: argparse.Namespace, chunks: List[Tuple[Table, Player]]) -> Checkpoint:
+    if options.resume and options.checkpoint.exists():
+        checkpoint = Checkpoint.load(options.checkpoint)
+    else:
+        checkpoint = Checkpoint(seed=options.seed)
+
+    keys = [f"{config_key(table)} {config_key(player)}" for table, player in chunks]
+    pending = [
+        (chunk_id, checkpoint.seed, table, player)
+        for chunk_id, (table, player) in enumerate(chunks)
+        if chunk_id not in checkpoint.completed
+    ]
+
+    setup_q: multiprocessing.SimpleQueue = multiprocessing.SimpleQueue()
+    results_q: multiprocessing.SimpleQueue = multiprocessing.SimpleQueue()
+    simulators = [Simulation(setup_q, results_q) for _ in range(options.workers)]
+    for worker in simulators:
+        worker.start()
+
+    for item in pending:
+        setup_q.put(item)
+    for _ in simulators:
+        setup_q.put((None, None))
+
+    last_save = time.monotonic()
+    for _ in pending:
+        chunk_id, table, player, sample = results_q.get()
+        checkpoint.record(chunk_id, keys[chunk_id], sample)
+        if time.monotonic() - last_save >= options.interval:
+            checkpoint.save(options.checkpoint)
+            last_save = time.monotonic()
+
+    checkpoint.save(options.checkpoint)
+    for worker in simulators:
+        worker.join()
+    return checkpoint
+
+
+if __name__ == "__main__":
+    table_player = [(Table(), Player()) for _ in range(100)]
+    main(get_options(), table_player)
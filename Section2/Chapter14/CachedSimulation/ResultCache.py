@@ -0,0 +1,188 @@
+import csv
+import enum
+import functools
+import hashlib
+import json
+import random
+import shutil
+import time
+import types
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+CODE_VERSION = "1"
+
+
+def canonical(obj: Any) -> Any:
+    """Reduce a resolved configuration to plain, ordered JSON values.
+
+    Objects are reduced to their class's module and qualified name and
+    every attribute, from ``__dict__`` or ``__slots__``. Functions and
+    classes are named by module and qualified name; lambdas and nested
+    functions have no such name and, like anything else unrecognised,
+    raise ``TypeError`` rather than fall back to an address.
+
+    >>> config_key({"rule": max}, None, 1) == config_key({"rule": min}, None, 1)
+    False
+    >>> canonical(functools.partial(round, ndigits=2))
+    {'__partial__': 'builtins.round', 'args': [], 'keywords': {'ndigits': 2}}
+    >>> canonical(lambda: 17)
+    Traceback (most recent call last):
+    ...
+    TypeError: Cannot build a cache key from function <lambda>
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, enum.Enum):
+        return canonical(obj.value)
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, (list, tuple)):
+        return [canonical(item) for item in obj]
+    if isinstance(obj, (set, frozenset)):
+        return sorted((canonical(item) for item in obj), key=lambda item: json.dumps(item, sort_keys=True))
+    if isinstance(obj, dict):
+        return {str(k): canonical(v) for k, v in sorted(obj.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(obj, (type, types.FunctionType, types.BuiltinFunctionType)):
+        return {"__function__": qualified_name(obj)}
+    if isinstance(obj, types.MethodType):
+        return {"__method__": obj.__func__.__name__, "self": canonical(obj.__self__)}
+    if isinstance(obj, functools.partial):
+        return {"__partial__": qualified_name(obj.func), "args": canonical(obj.args), "keywords": canonical(obj.keywords)}
+    slots = [
+        name for cls in type(obj).__mro__ for name in getattr(cls, "__slots__", ())
+        if name not in ("__dict__", "__weakref__") and hasattr(obj, name)
+    ]
+    if hasattr(obj, "__dict__") or slots:
+        state = {name: getattr(obj, name) for name in slots}
+        state.update(getattr(obj, "__dict__", {}))
+        return {"__class__": qualified_name(type(obj)), **canonical(state)}
+
+    raise TypeError(f"Cannot build a cache key from {obj.__class__.__qualname__} {obj!r}")
+
+
+def qualified_name(obj: Any) -> str:
+    if "<" in obj.__qualname__:
+        raise TypeError(f"Cannot build a cache key from {type(obj).__name__} {obj.__qualname__}")
+    return f"{obj.__module__}.{obj.__qualname__}"
+
+
+def config_key(
+        table: Any,
+        player: Any,
+        samples: int,
+        seed: Optional[int] = None,
+        code_version: str = CODE_VERSION
+) -> str:
+    document = {
+        "table": canonical(table),
+        "player": canonical(player),
+        "samples": samples,
+        "seed": seed,
+        "code_version": code_version,
+    }
+    text = json.dumps(document, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Content-addressed store of simulation results with size-based LRU eviction.
+
+    Each entry is a directory named by its key holding ``summary.json`` and
+    the raw ``output`` file. An entry's mtime is touched on every hit, so the
+    oldest mtime is the least recently used entry.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = 256 * 2**20) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / key
+
+    def get(self, key: str, outputfile: Path) -> Optional[Dict[str, Any]]:
+        entry = self._entry(key)
+        summary_path = entry / "summary.json"
+        if not summary_path.exists():
+            return None
+
+        shutil.copyfile(entry / "output", outputfile)
+        entry.touch()
+        return json.loads(summary_path.read_text())
+
+    def put(self, key: str, outputfile: Path, summary: Dict[str, Any]) -> None:
+        entry = self._entry(key)
+        staging = self.directory / f".{key}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir()
+        shutil.copyfile(outputfile, staging / "output")
+        (staging / "summary.json").write_text(json.dumps(summary, sort_keys=True))
+
+        shutil.rmtree(entry, ignore_errors=True)
+        staging.rename(entry)
+        self.evict()
+
+    def size(self, entry: Path) -> int:
+        return sum(f.stat().st_size for f in entry.iterdir())
+
+    def evict(self) -> None:
+        entries = [
+            (e.stat().st_mtime, self.size(e), e)
+            for e in self.directory.iterdir()
+            if e.is_dir() and not e.name.startswith(".")
+        ]
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+
+def cached_simulate(
+        simulate: Callable[[Any, Any, Path, int], Any],
+        table: Any,
+        player: Any,
+        outputfile: Path,
+        samples: int,
+        *,
+        cache: ResultCache,
+        seed: Optional[int] = None,
+        code_version: str = CODE_VERSION
+) -> Dict[str, Any]:
+    """Drop-in wrapper for ``simulate(table, player, outputfile, samples)``.
+
+    A configuration already in the cache returns its stored summary and
+    restores the raw output file without running the simulation.
+    """
+    outputfile = Path(outputfile)
+    key = config_key(table, player, samples, seed, code_version)
+
+    summary = cache.get(key, outputfile)
+    if summary is not None:
+        return summary
+
+    if seed is not None:
+        random.seed(seed)
+    start = time.perf_counter()
+    result = simulate(table, player, outputfile, samples)
+    elapsed = time.perf_counter() - start
+
+    with outputfile.open(newline="") as source:
+        rows = sum(1 for _ in csv.reader(source))
+    summary = {
+        "key": key,
+        "samples": samples,
+        "seed": seed,
+        "code_version": code_version,
+        "rows": rows,
+        "elapsed": elapsed,
+        "result": canonical(result),
+    }
+    cache.put(key, outputfile, summary)
+    return summary
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Any, Iterator, Tuple
+
+
+@dataclass
+class Simulate:
+    """Mock Simulation."""
+
+    table: Any
+    player: Any
+    samples: int
+
+    def __iter__(self) -> Iterator[Tuple]:
+        """Yield statistical samples."""
+        # Processing goes here...
+        return iter(())
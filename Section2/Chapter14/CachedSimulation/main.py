@@ -0,0 +1,32 @@
+import csv
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict
+
+from ResultCache import ResultCache, cached_simulate
+from Simulate import Simulate
+
+
+def simulate(table: Any, player: Any, outputfile: Path, samples: int) -> None:
+    """Write the samples to ``outputfile``, as NoConfigsSimulation does."""
+    simulator = Simulate(table, player, samples)
+    with outputfile.open("w", newline="") as results:
+        csv.writer(results).writerows(simulator)
+
+
+code = compile(open("../EXECConfigs/setup.py", "r").read(), "stringio", "exec")
+assignments: Dict[str, Any] = dict()
+exec(code, globals(), assignments)
+config = SimpleNamespace(**assignments)
+
+cache = ResultCache(Path.cwd() / "data" / "cache")
+summary = cached_simulate(
+    simulate,
+    config.table,
+    config.player,
+    config.outputfile,
+    config.samples,
+    cache=cache,
+    seed=42,
+)
+print(summary)
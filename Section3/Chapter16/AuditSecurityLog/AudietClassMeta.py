@@ -11,4 +11,4 @@ class AuditedClassMeta(LoggedClassMeta):
                 logger = logging.getLogger(f"{prefix}{result.__qualname__}")
                 setattr(result, item, logger)
 
-            return result
\ No newline at end of file
+        return result
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+GENESIS = "0" * 64
+
+
+def chain(previous: str, body: str) -> str:
+    return hashlib.sha256(f"{previous}{body}".encode("utf-8")).hexdigest()
+
+
+class HashChainHandler(logging.Handler):
+    """Append-only audit file where every line carries a hash over the previous one.
+
+    Each line is ``<sha256 hex> <JSON-encoded formatted record>``; the hash
+    covers the previous line's hash and this line's body, so editing,
+    removing or reordering any line breaks every later hash. Lines are
+    written immediately but ``fsync`` runs once per ``sync_records``
+    records or ``sync_interval`` seconds, which groups the cost of
+    durability across many bets. ``flush()`` and ``close()`` always sync.
+    """
+
+    def __init__(
+            self,
+            filename: Union[str, Path],
+            sync_records: int = 256,
+            sync_interval: float = 1.0,
+            level: int = logging.NOTSET
+    ) -> None:
+        super().__init__(level)
+        self.path = Path(filename)
+        self.sync_records = sync_records
+        self.sync_interval = sync_interval
+        self.previous = last_hash(self.path)
+        self.stream = self.path.open("a", encoding="utf-8")
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+        self._stop = threading.Event()
+        threading.Thread(target=self._tick, daemon=True).start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            body = json.dumps(self.format(record), ensure_ascii=False)
+            digest = chain(self.previous, body)
+            self.stream.write(f"{digest} {body}\n")
+            self.previous = digest
+            self.unsynced += 1
+            if self.unsynced >= self.sync_records or time.monotonic() - self.last_sync >= self.sync_interval:
+                self._sync()
+        except Exception:
+            self.handleError(record)
+
+    def _sync(self) -> None:
+        """Called with the handler lock held."""
+        if self.unsynced:
+            self.stream.flush()
+            os.fsync(self.stream.fileno())
+            self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    def _tick(self) -> None:
+        while not self._stop.wait(self.sync_interval):
+            self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self.stream.closed:
+                self._sync()
+
+    def close(self) -> None:
+        self._stop.set()
+        with self.lock:
+            if not self.stream.closed:
+                self._sync()
+                self.stream.close()
+        super().close()
+
+
+def last_hash(path: Path) -> str:
+    """The hash on the last line, read from the end of the file."""
+    if not path.exists() or path.stat().st_size == 0:
+        return GENESIS
+    with path.open("rb") as source:
+        source.seek(0, os.SEEK_END)
+        position = source.tell()
+        block = b""
+        while position > 0 and block.count(b"\n") < 2:
+            step = min(4096, position)
+            position -= step
+            source.seek(position)
+            block = source.read(step) + block
+    return block.rstrip(b"\n").rsplit(b"\n", 1)[-1].split(b" ", 1)[0].decode("ascii")
+
+
+def verify(path: Path) -> Tuple[bool, Optional[int]]:
+    """Recompute the chain; return (True, None) or (False, first bad line number)."""
+    previous = GENESIS
+    with path.open(encoding="utf-8") as source:
+        for number, line in enumerate(source, start=1):
+            digest, _, body = line.rstrip("\n").partition(" ")
+            previous = chain(previous, body)
+            if digest != previous:
+                return False, number
+    return True, None
+
+
+if __name__ == "__main__":
+    import sys
+
+    ok, line = verify(Path(sys.argv[1]))
+    print("OK" if ok else f"Chain broken at line {line}")
+    sys.exit(0 if ok else 1)
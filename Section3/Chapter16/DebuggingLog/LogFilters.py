@@ -0,0 +1,106 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+CallSite = Tuple[str, str, int]
+
+
+def call_site(record: logging.LogRecord) -> CallSite:
+    return record.name, record.pathname, record.lineno
+
+
+class RateLimitFilter(logging.Filter):
+    """Token bucket per call site: ``rate`` records per second, bursts up to ``burst``.
+
+    Records at ``exempt_level`` or above always pass. A record that passes
+    after some were suppressed carries the count as ``record.suppressed``.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, exempt_level: int = logging.WARNING) -> None:
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.exempt_level = exempt_level
+        self.buckets: Dict[CallSite, Tuple[float, float]] = {}
+        self.suppressed: Dict[CallSite, int] = {}
+        self.lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.exempt_level:
+            return True
+        key = call_site(record)
+        now = time.monotonic()
+        with self.lock:
+            tokens, last = self.buckets.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            if tokens < 1:
+                self.buckets[key] = (tokens, now)
+                self.suppressed[key] = self.suppressed.get(key, 0) + 1
+                return False
+            self.buckets[key] = (tokens - 1, now)
+            record.suppressed = self.suppressed.pop(key, 0)
+        return True
+
+
+class SampleFilter(logging.Filter):
+    """Pass the first of every ``every`` records from each call site."""
+
+    def __init__(self, every: int, exempt_level: int = logging.WARNING) -> None:
+        super().__init__()
+        self.every = every
+        self.exempt_level = exempt_level
+        self.counts: Dict[CallSite, int] = {}
+        self.lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.exempt_level:
+            return True
+        key = call_site(record)
+        with self.lock:
+            count = self.counts.get(key, 0)
+            self.counts[key] = count + 1
+        return count % self.every == 0
+
+
+class LazyAdapter(logging.LoggerAdapter):
+    """Builds a message only for records that will be emitted, at the call.
+
+    The message may be a callable returning the text; it is called after
+    the level check, so disabled levels cost one ``isEnabledFor()`` and
+    enabled ones capture state as it is now, unlike ``Lazy``. Records keep
+    the caller's file and line, so per-call-site filters still apply.
+
+    >>> logger.debug(lambda: f"Win: {self._state()}")
+    """
+
+    def log(self, level: int, msg: Any, *args: Any, **kwargs: Any) -> None:
+        if not self.isEnabledFor(level):
+            return
+        if callable(msg):
+            msg = msg()
+        msg, kwargs = self.process(msg, kwargs)
+        kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+        self.logger.log(level, msg, *args, **kwargs)
+
+
+class Lazy:
+    """A ``%s`` argument that calls ``function`` only when the record is formatted.
+
+    Formatting can happen much later than logging, in a buffering or queued
+    handler, so ``function`` must give the same answer then as now. Use it
+    only for expensive values that cannot change, never for mutable state.
+
+    >>> logger.debug("Layout %s", Lazy(lambda: render(frozen_table)))
+    """
+
+    __slots__ = ("function",)
+
+    def __init__(self, function: Callable[[], Any]) -> None:
+        self.function = function
+
+    def __str__(self) -> str:
+        return str(self.function())
+
+    def __repr__(self) -> str:
+        return repr(self.function())
@@ -1,13 +1,20 @@
 import logging
+from typing import List, Optional, Type, Union
 
 
 class LoggedClassMeta(type):
     def __new__(cls, name, bases, namespace, **kwargs):
         result = type.__new__(cls, name, bases, dict(namespace))
-        result.logger = logging.getLogger(result.__qualname__)
+        logger = logging.getLogger(result.__qualname__)
+        for log_filter in namespace.get("log_filters", ()):
+            logger.addFilter(log_filter)
+        adapter = getattr(result, "log_adapter", None)
+        result.logger = adapter(logger, {}) if adapter else logger
 
         return result
 
 
 class LoggedClass(metaclass=LoggedClassMeta):
-    logger: logging.Logger
+    logger: Union[logging.Logger, logging.LoggerAdapter]
+    log_filters: List[logging.Filter] = []
+    log_adapter: Optional[Type[logging.LoggerAdapter]] = None
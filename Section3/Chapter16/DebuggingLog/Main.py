@@ -1,5 +1,5 @@
 from LoggedClass import LoggedClass
-from typing import Dict
+from LogFilters import RateLimitFilter
 
 
 class BettingStrategy(LoggedClass):
@@ -14,22 +14,21 @@ class BettingStrategy(LoggedClass):
 
 
 class OneThreeTwoSix(BettingStrategy):
+    log_filters = [RateLimitFilter(rate=10, burst=100)]
+
     def __init__(self) -> None:
         self.wins = 0
 
-    def _state(self) -> Dict[str, int]:
-        return dict(wins=self.wins)
-
     def bet(self) -> int:
         bet = {0: 1, 1: 3, 2: 2, 3: 6}[self.wins % 4]
 
-        self.logger.debug(f"Bet {self._state()}; based on {bet}")
+        self.logger.debug("Bet %s; based on wins=%s", bet, self.wins)
         return bet
 
     def record_win(self) -> None:
         self.wins += 1
-        self.logger.debug(f"Win: {self._state()}")
+        self.logger.debug("Win: wins=%s", self.wins)
 
     def record_loss(self) -> None:
         self.wins = 0
-        self.logger.debug(f"Loss: {self._state()}")
+        self.logger.debug("Loss: wins=%s", self.wins)
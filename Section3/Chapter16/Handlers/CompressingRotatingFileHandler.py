@@ -0,0 +1,117 @@
+import gzip
+import logging
+import logging.handlers
+import lzma
+import os
+import queue
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+COMPRESSORS = {"gzip": (gzip.open, ".gz"), "lzma": (lzma.open, ".xz")}
+SECONDS = {"S": 1, "M": 60, "H": 3600, "D": 86400}
+
+
+class CompressingRotatingFileHandler(logging.handlers.BaseRotatingHandler):
+    """Rotate by size and/or time; compress and prune old segments in the background.
+
+    Rollover on the logging thread is only a close, a rename and an open.
+    The renamed segment is queued for a worker thread that compresses it
+    with ``gzip`` or ``lzma`` and keeps the newest ``backupCount`` segments.
+    ``maxBytes=0`` disables size rotation and ``when=None`` disables time
+    rotation. Usable from ``dictConfig``::
+
+        audit_file:
+          class: CompressingRotatingFileHandler.CompressingRotatingFileHandler
+          filename: data/test.log
+          maxBytes: 10485760
+          when: H
+          backupCount: 24
+          compression: gzip
+    """
+
+    def __init__(
+            self,
+            filename: str,
+            maxBytes: int = 0,
+            when: Optional[str] = None,
+            interval: int = 1,
+            backupCount: int = 5,
+            compression: str = "gzip",
+            encoding: Optional[str] = None,
+            delay: bool = False
+    ) -> None:
+        super().__init__(filename, "a", encoding=encoding, delay=delay)
+        if compression not in COMPRESSORS:
+            raise ValueError(f"Unknown compression {compression!r}")
+        self.maxBytes = maxBytes
+        self.period = SECONDS[when.upper()] * interval if when else None
+        self.backupCount = backupCount
+        self.compression = compression
+        self.rolloverAt = time.time() + self.period if self.period else None
+        self.segments: "queue.Queue[Optional[Path]]" = queue.Queue()
+        self.worker: Optional[threading.Thread] = None
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.rolloverAt is not None and time.time() >= self.rolloverAt:
+            return True
+        if self.maxBytes:
+            if self.stream is None:
+                self.stream = self._open()
+            return self.stream.tell() >= self.maxBytes
+        return False
+
+    def doRollover(self) -> None:
+        if self.stream:
+            self.stream.close()
+            self.stream = None  # type: ignore
+        base = Path(self.baseFilename)
+        if base.exists() and base.stat().st_size:
+            # One clock reading for both parts, so name order is rotation order.
+            seconds, nanoseconds = divmod(time.time_ns(), 10**9)
+            stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(seconds))
+            segment = base.with_name(f"{base.name}.{stamp}.{nanoseconds:09d}")
+            os.rename(base, segment)
+            self._start_worker()
+            self.segments.put(segment)
+        if self.period:
+            self.rolloverAt = time.time() + self.period
+        if not self.delay:
+            self.stream = self._open()
+
+    def _start_worker(self) -> None:
+        if self.worker is None or not self.worker.is_alive():
+            self.worker = threading.Thread(target=self._compress_segments, daemon=True)
+            self.worker.start()
+
+    def _compress_segments(self) -> None:
+        opener, suffix = COMPRESSORS[self.compression]
+        while True:
+            segment = self.segments.get()
+            if segment is None:
+                return
+            try:
+                with segment.open("rb") as source, opener(f"{segment}{suffix}", "wb") as target:
+                    shutil.copyfileobj(source, target)
+                segment.unlink()
+                self.prune()
+            except OSError:
+                logging.getLogger(__name__).exception("Could not compress %s", segment)
+
+    def prune(self) -> None:
+        """Keep the newest ``backupCount`` archives; raw segments still queued are left alone."""
+        base = Path(self.baseFilename)
+        suffix = COMPRESSORS[self.compression][1]
+        # Segment names end in a sortable timestamp, so name order is rotation order.
+        segments = sorted(base.parent.glob(f"{base.name}.*{suffix}"), reverse=True)
+        for old in segments[self.backupCount:]:
+            old.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Wait for queued segments to be compressed, then close the file."""
+        if self.worker is not None and self.worker.is_alive():
+            self.segments.put(None)
+            self.worker.join()
+        super().close()
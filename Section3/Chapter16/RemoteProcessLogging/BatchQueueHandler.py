@@ -0,0 +1,96 @@
+import copy
+import logging
+import os
+import pickle
+import threading
+import time
+import zlib
+from typing import Any, List, Optional, Tuple
+
+Batch = Tuple[bool, bytes]
+"""(compressed, payload): a pickled list of LogRecord attribute dicts."""
+
+
+class BatchQueueHandler(logging.Handler):
+    """Ship records to a queue in batches instead of one ``put()`` per record.
+
+    A batch is sent when it reaches ``batch_size`` records or when
+    ``interval`` seconds have passed since the last send, whichever is first.
+    A daemon thread in each process covers the interval when logging goes
+    quiet. Call ``close()`` (or ``flush()``) before the process exits.
+    """
+
+    def __init__(
+            self,
+            queue: Any,
+            batch_size: int = 256,
+            interval: float = 0.5,
+            compress: bool = False,
+            level: int = logging.NOTSET
+    ) -> None:
+        super().__init__(level)
+        self.queue = queue
+        self.batch_size = batch_size
+        self.interval = interval
+        self.compress = compress
+        self.pending: List[dict] = []
+        self.last_sent = time.monotonic()
+        self._timer_pid: Optional[int] = None
+
+    def prepare(self, record: logging.LogRecord) -> dict:
+        """Merge the message and drop unpicklable parts, as ``QueueHandler`` does."""
+        message = self.format(record)
+        record = copy.copy(record)
+        record.message = message
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        return record.__dict__
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self._timer_pid != os.getpid():
+                self._start_timer()
+            self.pending.append(self.prepare(record))
+            if len(self.pending) >= self.batch_size or time.monotonic() - self.last_sent >= self.interval:
+                self._send()
+        except Exception:
+            self.handleError(record)
+
+    def _send(self) -> None:
+        """Called with the handler lock held."""
+        if self.pending:
+            payload = pickle.dumps(self.pending, protocol=pickle.HIGHEST_PROTOCOL)
+            if self.compress:
+                payload = zlib.compress(payload)
+            self.queue.put((self.compress, payload))
+            self.pending = []
+        self.last_sent = time.monotonic()
+
+    def _start_timer(self) -> None:
+        self._timer_pid = os.getpid()
+        self._stop = threading.Event()
+        threading.Thread(target=self._tick, daemon=True).start()
+
+    def _tick(self) -> None:
+        while not self._stop.wait(self.interval):
+            if time.monotonic() - self.last_sent >= self.interval:
+                self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            self._send()
+
+    def close(self) -> None:
+        self.flush()
+        if self._timer_pid == os.getpid():
+            self._stop.set()
+        super().close()
+
+
+def unpack_batch(batch: Batch) -> List[logging.LogRecord]:
+    compressed, payload = batch
+    if compressed:
+        payload = zlib.decompress(payload)
+    return [logging.makeLogRecord(attributes) for attributes in pickle.loads(payload)]
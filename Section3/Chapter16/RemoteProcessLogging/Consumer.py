@@ -3,6 +3,7 @@ import logging
 import logging.config
 import multiprocessing
 import yaml
+from BatchQueueHandler import unpack_batch
 
 
 class LogConsumer(multiprocessing.Process):
@@ -18,12 +19,15 @@ class LogConsumer(multiprocessing.Process):
     def run(self) -> None:
         self.log.info("Consumer Started")
         while True:
-            log_record = self.source.get()
-            if log_record == None:
+            item = self.source.get()
+            if item == None:
                 break
 
-            self.combined.handle(log_record)
-            self.counts[log_record.getMessage()] += 1
+            records = [item] if isinstance(item, logging.LogRecord) else unpack_batch(item)
+            for log_record in records:
+                self.combined.handle(log_record)
+                # Count by source and level; formatting every message just to count it is wasted work.
+                self.counts[log_record.name, log_record.levelname] += 1
 
         self.log.info("Consumer Finished")
         self.log.info(self.counts)
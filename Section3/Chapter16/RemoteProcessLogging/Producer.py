@@ -2,10 +2,11 @@ import multiprocessing
 import time
 import logging
 import logging.handlers
+from BatchQueueHandler import BatchQueueHandler
 
 
 class LogProducer(multiprocessing.Process):
-    handler_class = logging.handlers.QueueHandler
+    handler_class = BatchQueueHandler
 
 
     def __init__(self, proc_id, queue):
@@ -23,4 +24,6 @@ class LogProducer(multiprocessing.Process):
             self.log.info(f"Message {i:d}")
             time.sleep(0.001)
 
-        self.log.info(f"Finished")
\ No newline at end of file
+        self.log.info(f"Finished")
+        for handler in self.log.handlers:
+            handler.close()
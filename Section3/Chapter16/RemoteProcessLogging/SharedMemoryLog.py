@@ -0,0 +1,179 @@
+import logging
+import multiprocessing
+import struct
+import time
+import zlib
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterator, Optional
+
+HEADER = struct.Struct("<QQQ")
+"""write index, read index, dropped records; padded to HEADER_SIZE bytes."""
+HEADER_SIZE = 64
+
+SLOT = struct.Struct("<QBIdH")
+"""commit sequence, level, logger id, timestamp, message length; the message bytes follow."""
+
+REGISTER = 0xFF
+"""Level of a record that binds a logger id to its name."""
+
+
+class SharedMemoryChannel:
+    """Fixed-size log records in a ring buffer in ``multiprocessing.shared_memory``.
+
+    Producers serialize on one lock only to reserve and fill a slot; the
+    single consumer never locks. A slot is readable once its commit
+    sequence equals its position + 1, which the producer writes last.
+    When the ring is full, ``overflow="drop"`` counts and discards the
+    record and ``overflow="block"`` waits up to ``timeout`` seconds first.
+
+    The producers' lock is a ``multiprocessing.Lock``, which can only be
+    shared by inheritance: pass the channel to each ``Process``. A channel
+    attached with ``name=`` has no lock and can only be read from.
+    """
+
+    def __init__(
+            self,
+            capacity: int = 4096,
+            slot_size: int = 256,
+            overflow: str = "drop",
+            timeout: float = 1.0,
+            name: Optional[str] = None
+    ) -> None:
+        if overflow not in ("drop", "block"):
+            raise ValueError(f"Unknown overflow policy {overflow!r}")
+        self.capacity = capacity
+        self.slot_size = slot_size
+        self.overflow = overflow
+        self.timeout = timeout
+        create = name is None
+        self.lock = multiprocessing.Lock() if create else None
+        self.shm = shared_memory.SharedMemory(
+            name=name, create=create, size=HEADER_SIZE + capacity * slot_size
+        )
+        if create:
+            self.shm.buf[:HEADER_SIZE + capacity * slot_size] = bytes(HEADER_SIZE + capacity * slot_size)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["shm"] = self.shm.name
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.shm = shared_memory.SharedMemory(name=state["shm"])
+
+    def _header(self) -> tuple:
+        return HEADER.unpack_from(self.shm.buf, 0)
+
+    @property
+    def dropped(self) -> int:
+        return self._header()[2]
+
+    def stats(self) -> Dict[str, int]:
+        write, read, dropped = self._header()
+        return dict(written=write, read=read, pending=write - read, dropped=dropped)
+
+    def write(self, level: int, logger_id: int, created: float, message: bytes) -> bool:
+        if self.lock is None:
+            raise RuntimeError("A channel attached by name is read-only; producers must inherit the channel")
+        message = message[:self.slot_size - SLOT.size]
+        deadline = time.monotonic() + self.timeout
+        while True:
+            with self.lock:
+                write, read, dropped = self._header()
+                if write - read < self.capacity:
+                    offset = HEADER_SIZE + (write % self.capacity) * self.slot_size
+                    start = offset + SLOT.size
+                    self.shm.buf[start:start + len(message)] = message
+                    SLOT.pack_into(self.shm.buf, offset, 0, level, logger_id, created, len(message))
+                    # The commit sequence is written last; it publishes the slot.
+                    struct.pack_into("<Q", self.shm.buf, offset, write + 1)
+                    struct.pack_into("<Q", self.shm.buf, 0, write + 1)
+                    return True
+                if self.overflow == "drop" or time.monotonic() >= deadline:
+                    struct.pack_into("<Q", self.shm.buf, 16, dropped + 1)
+                    return False
+            time.sleep(0.0005)
+
+    def read(self) -> Iterator[tuple]:
+        """Yield (level, logger id, timestamp, message) for every committed slot."""
+        read = self._header()[1]
+        while True:
+            offset = HEADER_SIZE + (read % self.capacity) * self.slot_size
+            sequence, level, logger_id, created, length = SLOT.unpack_from(self.shm.buf, offset)
+            if sequence != read + 1:
+                return
+            start = offset + SLOT.size
+            message = bytes(self.shm.buf[start:start + length])
+            read += 1
+            struct.pack_into("<Q", self.shm.buf, 8, read)
+            yield level, logger_id, created, message
+
+    def close(self) -> None:
+        self.shm.close()
+
+    def unlink(self) -> None:
+        self.shm.unlink()
+
+
+class SharedMemoryHandler(logging.Handler):
+    """Producer side: a drop-in handler that writes formatted records to the channel."""
+
+    def __init__(self, channel: SharedMemoryChannel, level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        self.channel = channel
+        self.registered: Dict[str, int] = {}
+
+    def logger_id(self, name: str) -> int:
+        if name in self.registered:
+            return self.registered[name]
+        logger_id = zlib.crc32(name.encode("utf-8"))
+        # A dropped registration is retried with the next record from this logger.
+        if self.channel.write(REGISTER, logger_id, time.time(), name.encode("utf-8")):
+            self.registered[name] = logger_id
+        return logger_id
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            message = self.format(record).encode("utf-8")
+            self.channel.write(record.levelno, self.logger_id(record.name), record.created, message)
+        except Exception:
+            self.handleError(record)
+
+
+class SharedMemoryReader:
+    """Consumer side: rebuilds LogRecords and hands them to a logger such as ``LogConsumer.combined``."""
+
+    def __init__(self, channel: SharedMemoryChannel) -> None:
+        self.channel = channel
+        self.names: Dict[int, str] = {}
+
+    def records(self) -> Iterator[logging.LogRecord]:
+        for level, logger_id, created, message in self.channel.read():
+            text = message.decode("utf-8", errors="replace")
+            if level == REGISTER:
+                self.names[logger_id] = text
+                continue
+            yield logging.makeLogRecord(dict(
+                name=self.names.get(logger_id, str(logger_id)),
+                levelno=level,
+                levelname=logging.getLevelName(level),
+                msg=text,
+                created=created,
+            ))
+
+    def drain(self, logger: logging.Logger) -> int:
+        count = 0
+        for record in self.records():
+            logger.handle(record)
+            count += 1
+        return count
+
+    def run(self, logger: logging.Logger, finished: Any, poll: float = 0.01) -> None:
+        """Drain until ``finished`` (an ``Event``) is set and the ring is empty."""
+        while True:
+            done = finished.is_set()
+            if not self.drain(logger):
+                if done:
+                    return
+                time.sleep(poll)
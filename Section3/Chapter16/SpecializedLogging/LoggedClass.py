@@ -1,13 +1,16 @@
 import logging
+from Metrics import Metrics, getMetrics
 
 
 class LoggedClassMeta(type):
     def __new__(cls, name, bases, namespace, **kwargs):
         result = type.__new__(cls, name, bases, dict(namespace))
         result.logger = logging.getLogger(result.__qualname__)
+        result.metrics = getMetrics(result.__qualname__)
 
         return result
 
 
 class LoggedClass(metaclass=LoggedClassMeta):
     logger: logging.Logger
+    metrics: Metrics
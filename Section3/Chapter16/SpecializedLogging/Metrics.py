@@ -0,0 +1,147 @@
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+DEFAULT_BOUNDS = (0.001, 0.01, 0.1, 1.0, 10.0, 100.0)
+
+
+class Histogram:
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BOUNDS) -> None:
+        self.bounds = tuple(bounds)
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def observe(self, value: float) -> None:
+        index = 0
+        while index < len(self.bounds) and value > self.bounds[index]:
+            index += 1
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def summary(self) -> Dict[str, Any]:
+        return dict(
+            count=self.count, sum=self.total, min=self.min, max=self.max,
+            buckets=dict(zip([*map(str, self.bounds), "inf"], self.buckets)),
+        )
+
+
+class MetricsRegistry:
+    """Counters, gauges and histograms aggregated in this process.
+
+    Updates take one uncontended lock and never format anything. ``flush()``
+    writes the deltas since the previous flush as one JSON line, tagged with
+    the process id, to the ``metrics`` logger or a local file. After a fork
+    the child starts from an empty registry, so each process reports only
+    its own events.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.path: Optional[Path] = None
+        self.logger = logging.getLogger("metrics")
+        self._reset()
+        self._stop: Optional[threading.Event] = None
+
+    def _reset(self) -> None:
+        self.pid = os.getpid()
+        self.counters: Dict[str, int] = {}
+        self.gauges: Dict[str, float] = {}
+        self.histograms: Dict[str, Histogram] = {}
+
+    def _check_pid(self) -> None:
+        if self.pid != os.getpid():
+            self._reset()
+
+    def inc(self, name: str, amount: int = 1) -> None:
+        with self.lock:
+            self._check_pid()
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def set(self, name: str, value: float) -> None:
+        with self.lock:
+            self._check_pid()
+            self.gauges[name] = value
+
+    def observe(self, name: str, value: float) -> None:
+        with self.lock:
+            self._check_pid()
+            if name not in self.histograms:
+                self.histograms[name] = Histogram()
+            self.histograms[name].observe(value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """The deltas since the last snapshot; gauges keep their last value."""
+        with self.lock:
+            self._check_pid()
+            document = dict(
+                time=time.time(), pid=self.pid,
+                counters=self.counters, gauges=dict(self.gauges),
+                histograms={k: h.summary() for k, h in self.histograms.items()},
+            )
+            self.counters, self.histograms = {}, {}
+        return document
+
+    def flush(self) -> None:
+        document = self.snapshot()
+        if not document["counters"] and not document["histograms"] and not document["gauges"]:
+            return
+        line = json.dumps(document, sort_keys=True)
+        if self.path is None:
+            self.logger.info(line)
+        else:
+            with self.path.open("a") as target:
+                target.write(line + "\n")
+
+    def start(self, interval: float = 10.0, path: Optional[Path] = None) -> None:
+        """Flush every ``interval`` seconds from a daemon thread, to ``path`` if given."""
+        self.path = path
+        self._stop = threading.Event()
+
+        def run(stop: threading.Event) -> None:
+            while not stop.wait(interval):
+                self.flush()
+
+        threading.Thread(target=run, args=(self._stop,), daemon=True).start()
+
+    def stop(self) -> None:
+        if self._stop is not None:
+            self._stop.set()
+        self.flush()
+
+
+registry = MetricsRegistry()
+
+
+class Metrics:
+    """A named view of the registry, the way a Logger is a named view of logging."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def inc(self, name: str, amount: int = 1) -> None:
+        registry.inc(f"{self.name}.{name}", amount)
+
+    def set(self, name: str, value: float) -> None:
+        registry.set(f"{self.name}.{name}", value)
+
+    def observe(self, name: str, value: float) -> None:
+        registry.observe(f"{self.name}.{name}", value)
+
+
+_metrics: Dict[str, Metrics] = {}
+
+
+def getMetrics(name: str) -> Metrics:
+    if name not in _metrics:
+        _metrics[name] = Metrics(name)
+    return _metrics[name]
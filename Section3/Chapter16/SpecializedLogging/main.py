@@ -1,17 +1,14 @@
-from collections import Counter
 from LoggedClass import LoggedClass
+from Metrics import registry
 
 
 class Main(LoggedClass):
-    def __init__(self) -> None:
-        self.counts: Counter[str] = Counter()
-
     def run(self) -> None:
         self.logger.info("Start")
 
         # Some processing in and around the counter increments
-        self.counts["input"] += 2000
-        self.counts["reject"] += 500
-        self.counts["output"] += 1500
+        self.metrics.inc("input", 2000)
+        self.metrics.inc("reject", 500)
+        self.metrics.inc("output", 1500)
 
-        self.logger.info(f"Counts {self.counts!s}")
\ No newline at end of file
+        registry.flush()
\ No newline at end of file
@@ -1,20 +1,48 @@
+import collections
+import logging
 import logging.handlers
+from typing import Optional
 
 
 class TailHandler(logging.handlers.MemoryHandler):
+    """Keep the last ``capacity`` records; dump them when one at ``flushLevel`` arrives.
+
+    The buffer is a ``deque(maxlen=capacity)``, so accepting a record is an
+    O(1) append that silently drops the oldest one. ``deque.append`` is
+    atomic, so the handler lock is only taken to dump the tail.
+    """
+
+    def __init__(
+            self,
+            capacity: int,
+            flushLevel: int = logging.ERROR,
+            target: Optional[logging.Handler] = None,
+            flushOnClose: bool = False
+    ) -> None:
+        super().__init__(capacity, flushLevel, target, flushOnClose)
+        self.buffer = collections.deque(maxlen=capacity)  # type: ignore
+
     def shouldFlush(self, record: logging.LogRecord) -> bool:
         """
-        Check for buffer full or a record at the flushLevel or higher.
+        Check for a record at the flushLevel or higher; a full buffer never flushes.
         """
 
-        if record.levelno >= self.flushLevel:
-            return True
+        return record.levelno >= self.flushLevel
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        if not self.filter(record):
+            return False
 
-        while len(self.buffer) > self.capacity:
-            self.acquire()
-            try:
-                del self.buffer[0]
-            finally:
-                self.release()
+        self.buffer.append(record)
+        if self.shouldFlush(record):
+            self.flush()
+        return True
 
-            return False
\ No newline at end of file
+    def flush(self) -> None:
+        with self.lock:
+            if self.target is None:
+                return
+            # popleft() is atomic, so records arriving during the dump are kept for the next one.
+            records = [self.buffer.popleft() for _ in range(len(self.buffer))]
+            for record in records:
+                self.target.handle(record)